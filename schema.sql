@@ -6,9 +6,24 @@ CREATE TABLE IF NOT EXISTS zettelkasten (
     zettel_id TEXT PRIMARY KEY,
     note TEXT NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    modified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    modified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    char_count INTEGER,
+    conn_count INTEGER NOT NULL DEFAULT 0
 );
 
+-- Materialized counters: maintained at write time so reads never COUNT(*)
+CREATE TRIGGER IF NOT EXISTS zettel_char_count_ins AFTER INSERT ON zettelkasten
+BEGIN
+    UPDATE zettelkasten SET char_count = LENGTH(NEW.note)
+    WHERE zettel_id = NEW.zettel_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS zettel_char_count_upd AFTER UPDATE OF note ON zettelkasten
+BEGIN
+    UPDATE zettelkasten SET char_count = LENGTH(NEW.note)
+    WHERE zettel_id = NEW.zettel_id;
+END;
+
 -- Links between notes (directional)
 CREATE TABLE IF NOT EXISTS zettel_links (
     from_zettel_id TEXT REFERENCES zettelkasten(zettel_id) ON DELETE CASCADE,
@@ -17,9 +32,26 @@ CREATE TABLE IF NOT EXISTS zettel_links (
     CHECK(from_zettel_id != to_zettel_id)
 );
 
+CREATE TRIGGER IF NOT EXISTS links_ins AFTER INSERT ON zettel_links
+BEGIN
+    UPDATE zettelkasten SET conn_count = conn_count + 1
+    WHERE zettel_id IN (NEW.from_zettel_id, NEW.to_zettel_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS links_del AFTER DELETE ON zettel_links
+BEGIN
+    UPDATE zettelkasten SET conn_count = conn_count - 1
+    WHERE zettel_id IN (OLD.from_zettel_id, OLD.to_zettel_id);
+END;
+
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_zl_from ON zettel_links(from_zettel_id);
-CREATE INDEX IF NOT EXISTS idx_zl_to ON zettel_links(to_zettel_id);
+-- (to, from) is covering for inbound traversals that also read the source id
+CREATE INDEX IF NOT EXISTS idx_zl_to ON zettel_links(to_zettel_id, from_zettel_id);
+
+-- Orphans are answered by a partial index range scan; hubs by conn_count order
+CREATE INDEX IF NOT EXISTS idx_orphans ON zettelkasten(created_at DESC) WHERE conn_count = 0;
+CREATE INDEX IF NOT EXISTS idx_hubs ON zettelkasten(conn_count DESC);
 
 -- Optional: Insight index for categorization
 CREATE TABLE IF NOT EXISTS insight_index (
@@ -32,3 +64,35 @@ CREATE TABLE IF NOT EXISTS zettel_insight_index (
     index_id TEXT REFERENCES insight_index(id) ON DELETE CASCADE,
     PRIMARY KEY (zettel_id, index_id)
 );
+
+-- Lookup by insight (the PK only serves zettel_id-first probes)
+CREATE INDEX IF NOT EXISTS idx_zii_index ON zettel_insight_index(index_id);
+
+-- Full-text search shadow table, kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS zettel_fts USING fts5(
+    zettel_id UNINDEXED,
+    note,
+    content='zettelkasten',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS zettel_fts_ins AFTER INSERT ON zettelkasten
+BEGIN
+    INSERT INTO zettel_fts(rowid, zettel_id, note)
+    VALUES (NEW.rowid, NEW.zettel_id, NEW.note);
+END;
+
+CREATE TRIGGER IF NOT EXISTS zettel_fts_del AFTER DELETE ON zettelkasten
+BEGIN
+    INSERT INTO zettel_fts(zettel_fts, rowid, zettel_id, note)
+    VALUES ('delete', OLD.rowid, OLD.zettel_id, OLD.note);
+END;
+
+CREATE TRIGGER IF NOT EXISTS zettel_fts_upd AFTER UPDATE OF note ON zettelkasten
+BEGIN
+    INSERT INTO zettel_fts(zettel_fts, rowid, zettel_id, note)
+    VALUES ('delete', OLD.rowid, OLD.zettel_id, OLD.note);
+    INSERT INTO zettel_fts(rowid, zettel_id, note)
+    VALUES (NEW.rowid, NEW.zettel_id, NEW.note);
+END;
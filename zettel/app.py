@@ -7,6 +7,7 @@ from textual.widgets import Header, Footer
 
 from .screens.browse_screen import BrowseScreen
 from .screens.main import MainScreen
+from .utils import ZettelDB
 from config import DB_PATH, STYLES_PATH
 
 
@@ -36,6 +37,8 @@ class ZettelApp(App):
     def __init__(self, initial_card: str = None, **kwargs):
         super().__init__(**kwargs)
         self.db_path = DB_PATH
+        # One ZettelDB for the whole app; every screen shares it
+        self.db = ZettelDB(self.db_path)
         self.initial_card = initial_card
 
     def compose(self) -> ComposeResult:
@@ -47,12 +50,16 @@ class ZettelApp(App):
         """Initialize the app."""
         if self.initial_card:
             # Go directly to card view if card specified
-            self.push_screen(MainScreen(initial_card=self.initial_card))
+            self.push_screen(MainScreen(initial_card=self.initial_card, db=self.db))
         else:
             # Default to browse screen
-            self.push_screen(BrowseScreen())
+            self.push_screen(BrowseScreen(db=self.db))
 
 
+    def on_unmount(self) -> None:
+        """Close the shared database connection on shutdown."""
+        self.db.close()
+
 def main(card: str = None) -> None:
     """Run the Zettelkasten app."""
     app = ZettelApp(initial_card=card)
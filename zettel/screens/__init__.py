@@ -8,8 +8,6 @@ from zettel.screens.search_modal import SearchModal
 
 # Keep old screens for reference (can delete later)
 # from .dashboard import DashboardScreen
-# from .browser import BrowserScreen
-# from .card_view import CardViewScreen
 
 __all__ = [
     'MainScreen',
@@ -8,8 +8,10 @@ from textual.widgets import Static, DataTable, Input
 from textual.containers import Vertical, Horizontal
 from textual.binding import Binding
 from textual.reactive import reactive
+from textual import work
+from rich.text import Text
 
-from zettel.utils import ZettelDB
+from zettel.utils import Card, ZettelDB
 
 
 class BrowseScreen(Screen):
@@ -42,6 +44,14 @@ class BrowseScreen(Screen):
     filter_text: reactive[str] = reactive("")
     card_mode: reactive[str] = reactive("recent")  # recent, hubs, orphans
 
+    # Virtual scrolling: rows added to the DataTable per batch, and how close
+    # the cursor gets to the populated edge before the next batch streams in.
+    WINDOW_ROWS = 40
+    OVERSCAN_ROWS = 10
+
+    # Seconds to wait after the last filter keystroke before reloading
+    FILTER_DEBOUNCE = 0.12
+
     def __init__(
         self,
         db: ZettelDB = None,
@@ -51,8 +61,24 @@ class BrowseScreen(Screen):
         super().__init__(**kwargs)
         self.db = db or ZettelDB()
         self.on_selected = on_selected
-        self._all_cards: list[dict] = []
+        self._all_cards: list[Card] = []
         self._all_insights: list[dict] = []
+        self._visible_cards: list[Card] = []
+        self._populated_rows: int = 0
+        self._current_keys: set[str] = set()
+        self._filter_timer = None
+        self._table: DataTable = None  # cached in on_mount
+        self._current_columns: str = ""  # "cards" or "insights"
+        # Unfiltered result lists per mode ("recent", "hubs", "orphans",
+        # "insights"); invalidated when the data actually changes
+        self._mode_cache: dict[str, list] = {}
+        # Last applied filter and its matches: when the user keeps typing
+        # ("1" -> "12") the new matches are a subset of the old ones, so
+        # narrowing scans the previous result instead of requerying
+        self._last_filter: str = ""
+        self._last_filtered: list[Card] = []
+        self._last_ins_filter: str = ""
+        self._last_ins_filtered: list[dict] = []
 
     def compose(self) -> ComposeResult:
         """Compose the browse screen."""
@@ -71,8 +97,8 @@ class BrowseScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize the screen."""
-        # Setup table
-        table = self.query_one("#browse-table", DataTable)
+        # Setup table (cached - query_one is a DOM walk)
+        table = self._table = self.query_one("#browse-table", DataTable)
         self._setup_card_columns(table)
 
         # Hide filter input initially
@@ -85,9 +111,29 @@ class BrowseScreen(Screen):
         # Focus the table
         table.focus()
 
+    def on_screen_resume(self) -> None:
+        """Refresh listings when returning from another screen.
+
+        Cards and links are routinely created from the main screen's
+        modals, which can't reach this screen's cache; anything cached
+        before we were covered may be stale, so drop it and reload the
+        current view.
+        """
+        self._mode_cache.clear()
+        self._last_filter = ""
+        self._last_filtered = []
+        self._last_ins_filter = ""
+        self._last_ins_filtered = []
+        if self.view_mode == "insights":
+            self._load_insights(self.filter_text)
+        else:
+            self._load_cards(self.filter_text)
+
     def _setup_card_columns(self, table: DataTable) -> None:
         """Setup columns for card view."""
         table.clear(columns=True)
+        self._current_keys.clear()
+        self._current_columns = "cards"
         table.add_column("ID", width=12)
         table.add_column("Note", width=50)
         table.add_column("#", width=4)
@@ -96,64 +142,189 @@ class BrowseScreen(Screen):
     def _setup_insight_columns(self, table: DataTable) -> None:
         """Setup columns for insight index view."""
         table.clear(columns=True)
+        self._current_keys.clear()
+        self._current_columns = "insights"
         table.add_column("Insight", width=30)
         table.add_column("Cards", width=8)
 
     def _load_cards(self, filter_text: str = "") -> None:
         """Load cards based on current mode and filter."""
-        table = self.query_one("#browse-table", DataTable)
-        table.clear()
+        # Narrowing filter: scan the previous matches instead of requerying
+        if (filter_text and self._last_filter
+                and filter_text.startswith(self._last_filter)):
+            cards = [c for c in self._last_filtered if filter_text in c.zettel_id]
+            self._apply_cards(cards, filter_text)
+            return
+
+        # Unfiltered loads served from the per-mode cache need no worker
+        cards = None if filter_text else self._mode_cache.get(self.card_mode)
+        if cards is not None:
+            self._apply_cards(cards, filter_text)
+            return
+
+        self._fetch_cards(self.card_mode, filter_text)
+
+    @work(exclusive=True, thread=True, group="browse-load")
+    def _fetch_cards(self, card_mode: str, filter_text: str) -> None:
+        """Run the mode query off the event loop; rapid calls cancel stale ones."""
+        filter_substr = filter_text or None
+
+        # The ID filter is applied in SQL
+        if card_mode == "hubs":
+            cards = self.db.get_hubs(limit=100, filter_substr=filter_substr)
+        elif card_mode == "orphans":
+            cards = self.db.get_orphans(filter_substr=filter_substr)
+        else:
+            cards = self.db.get_all_cards(limit=200, filter_substr=filter_substr)
+
+        self.app.call_from_thread(
+            self._apply_cards, cards, filter_text, filter_substr is None, card_mode
+        )
+
+    def _apply_cards(
+        self,
+        cards: list[Card],
+        filter_text: str,
+        cache: bool = False,
+        card_mode: str = None,
+    ) -> None:
+        """Apply a fetched card list to the table (runs on the UI thread)."""
+        # Worker cancellation is cooperative, so a slow query can land
+        # after the user switched mode or view; stale results must not
+        # render under the wrong title, poison the new mode's cache, or
+        # hit the insight table's columns (same guard as the search
+        # modal's _stream_rows)
+        if card_mode is None:
+            card_mode = self.card_mode
+        if card_mode != self.card_mode or self.view_mode == "insights":
+            return
+
+        if cache:
+            self._mode_cache[card_mode] = cards
+
+        self._all_cards = cards
+        if filter_text:
+            self._last_filter = filter_text
+            self._last_filtered = cards
+        else:
+            self._last_filter = ""
+            self._last_filtered = []
 
-        # Fetch based on mode
-        if self.card_mode == "hubs":
-            cards = self.db.get_hubs(limit=100)
+        if card_mode == "hubs":
             title = "[bold cyan]HUBS[/] (Most Connected)"
-        elif self.card_mode == "orphans":
-            cards = self.db.get_orphans()
+        elif card_mode == "orphans":
             title = "[bold red]ORPHANS[/] (No Connections)"
         else:
-            cards = self.db.get_all_cards(limit=200)
             title = "[bold cyan]ZETTELKASTEN[/]"
 
-        self._all_cards = cards
-
-        # Apply filter (zettel_id only - numeric search)
         if filter_text:
-            cards = [c for c in cards if filter_text in c['zettel_id']]
             title += f" [dim](id: {filter_text})[/]"
 
         # Update title and stats
         self.query_one("#browse-title", Static).update(title)
         self.query_one("#browse-stats", Static).update(f"[dim]{len(cards)} notes[/]")
 
-        # Populate table
-        for card in cards:
-            preview = card['note'].replace('\n', ' ')[:45]
-            if len(card['note']) > 45:
-                preview += "..."
-
-            created = card['created_at'][:10] if card['created_at'] else ''
-
-            table.add_row(
-                card['zettel_id'],
-                preview,
-                str(card['connection_count']),
-                created,
-                key=card['zettel_id']
-            )
+        table = self._table
+        self._populate_table(table, cards)
+
+    def _populate_table(self, table: DataTable, cards: list[Card]) -> None:
+        """Populate the table, diffing against current rows where possible."""
+        new_keys = {c.zettel_id for c in cards}
+
+        if self._current_keys and new_keys <= self._current_keys:
+            # Narrowing filter: every surviving row is already in the table,
+            # so just drop the ones that fell out (preserves scroll/cursor)
+            for key in self._current_keys - new_keys:
+                table.remove_row(key)
+            self._current_keys = new_keys
+            self._visible_cards = cards
+            self._populated_rows = len(cards)
+        else:
+            # Different row set: rebuild the visible window from scratch;
+            # the rest stream in on demand
+            table.clear()
+            self._current_keys = set()
+            self._visible_cards = cards
+            self._populated_rows = 0
+            self._populate_window(table)
+
+    def _populate_window(self, table: DataTable) -> None:
+        """Add the next window of card rows to the table (virtual scrolling)."""
+        end = min(self._populated_rows + self.WINDOW_ROWS, len(self._visible_cards))
+
+        # Suspend screen updates so the whole batch lays out once
+        with self.app.batch_update():
+            for card in self._visible_cards[self._populated_rows:end]:
+                preview = card.preview_raw[:45]
+                if card.note_len > 45:
+                    preview += "..."
+
+                created = card.created_at[:10] if card.created_at else ''
+
+                # Plain Text cells skip Rich's markup parser; note previews
+                # are user text and must never be interpreted as markup
+                table.add_row(
+                    card.zettel_id,
+                    Text(preview, no_wrap=True, overflow="ellipsis"),
+                    Text(str(card.connection_count)),
+                    created,
+                    key=card.zettel_id
+                )
+                self._current_keys.add(card.zettel_id)
+
+        self._populated_rows = end
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Stream in more rows as the cursor nears the populated edge."""
+        if self._populated_rows >= len(self._visible_cards):
+            return
+        if event.cursor_row >= self._populated_rows - self.OVERSCAN_ROWS:
+            self._populate_window(event.data_table)
 
     def _load_insights(self, filter_text: str = "") -> None:
         """Load insight index."""
-        table = self.query_one("#browse-table", DataTable)
-        table.clear()
+        insights = self._mode_cache.get("insights")
+        if insights is not None:
+            self._apply_insights(insights, filter_text)
+            return
+
+        self._fetch_insights(filter_text)
 
+    @work(exclusive=True, thread=True, group="browse-load")
+    def _fetch_insights(self, filter_text: str) -> None:
+        """Query the insight index off the event loop."""
         insights = self.db.get_insight_index()
+        self.app.call_from_thread(self._apply_insights, insights, filter_text, True)
+
+    def _apply_insights(self, insights: list[dict], filter_text: str, cache: bool = False) -> None:
+        """Apply a fetched insight list to the table (runs on the UI thread)."""
+        # Mirror of the _apply_cards guard: if the user left the insights
+        # view while the query ran, its rows belong to the cards table now
+        if self.view_mode != "insights":
+            return
+
+        if cache:
+            self._mode_cache["insights"] = insights
+
+        table = self._table
+        table.clear()
+        self._current_keys.clear()
+        self._visible_cards = []
+        self._populated_rows = 0
+
         self._all_insights = insights
 
-        # Apply filter
+        # Apply filter, reusing the previous matches when narrowing
         if filter_text:
             filter_lower = filter_text.lower()
+            if self._last_ins_filter and filter_lower.startswith(self._last_ins_filter):
+                insights = self._last_ins_filtered
             insights = [i for i in insights if filter_lower in i['index_name'].lower()]
+            self._last_ins_filter = filter_lower
+            self._last_ins_filtered = insights
+        else:
+            self._last_ins_filter = ""
+            self._last_ins_filtered = []
 
         # Update title
         title = "[bold purple]INSIGHT INDEX[/]"
@@ -162,13 +333,14 @@ class BrowseScreen(Screen):
         self.query_one("#browse-title", Static).update(title)
         self.query_one("#browse-stats", Static).update(f"[dim]{len(insights)} tags[/]")
 
-        # Populate table
-        for insight in insights:
-            table.add_row(
-                insight['index_name'],
-                str(insight['card_count']),
-                key=f"insight:{insight['id']}"
-            )
+        # Populate table in one layout pass
+        with self.app.batch_update():
+            for insight in insights:
+                table.add_row(
+                    Text(insight['index_name'], no_wrap=True, overflow="ellipsis"),
+                    Text(str(insight['card_count'])),
+                    key=f"insight:{insight['id']}"
+                )
 
     def action_start_filter(self) -> None:
         """Show and focus the filter input."""
@@ -183,80 +355,82 @@ class BrowseScreen(Screen):
         filter_input.focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle filter input changes."""
+        """Handle filter input changes (debounced)."""
         if event.input.id == "filter-input":
             self.filter_text = event.value
-            if self.view_mode == "insights":
-                self._load_insights(event.value)
-            else:
-                self._load_cards(event.value)
+            # Only the last keystroke in a burst triggers a reload
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(self.FILTER_DEBOUNCE, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        """Reload the current view with the latest filter text."""
+        self._filter_timer = None
+        if self.view_mode == "insights":
+            self._load_insights(self.filter_text)
+        else:
+            self._load_cards(self.filter_text)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle filter input submit - refocus table."""
         if event.input.id == "filter-input":
-            table = self.query_one("#browse-table", DataTable)
+            table = self._table
             table.focus()
 
+    def _switch_mode(self, card_mode: str) -> None:
+        """Switch to a card mode, rebuilding columns only when they change."""
+        self.view_mode = "cards"
+        self.card_mode = card_mode
+        # Previous matches belong to the old mode; don't narrow from them
+        self._last_filter = ""
+        self._last_filtered = []
+        if self._current_columns != "cards":
+            self._setup_card_columns(self._table)
+        self._load_cards(self.filter_text)
+        self._table.focus()
+
     def action_toggle_insights(self) -> None:
         """Toggle between cards and insight index view."""
-        table = self.query_one("#browse-table", DataTable)
-
         if self.view_mode == "cards":
             self.view_mode = "insights"
-            self._setup_insight_columns(table)
+            self._setup_insight_columns(self._table)
             self._load_insights(self.filter_text)
+            self._table.focus()
         else:
-            self.view_mode = "cards"
-            self._setup_card_columns(table)
-            self._load_cards(self.filter_text)
-
-        table.focus()
+            self._switch_mode(self.card_mode)
 
     def action_show_hubs(self) -> None:
         """Show most connected cards."""
-        self.view_mode = "cards"
-        self.card_mode = "hubs"
-        table = self.query_one("#browse-table", DataTable)
-        self._setup_card_columns(table)
-        self._load_cards(self.filter_text)
-        table.focus()
+        self._switch_mode("hubs")
 
     def action_show_orphans(self) -> None:
         """Show orphan cards."""
-        self.view_mode = "cards"
-        self.card_mode = "orphans"
-        table = self.query_one("#browse-table", DataTable)
-        self._setup_card_columns(table)
-        self._load_cards(self.filter_text)
-        table.focus()
+        self._switch_mode("orphans")
 
     def action_show_recent(self) -> None:
         """Show recent cards (default)."""
-        self.view_mode = "cards"
-        self.card_mode = "recent"
-        table = self.query_one("#browse-table", DataTable)
-        self._setup_card_columns(table)
-        self._load_cards(self.filter_text)
-        table.focus()
+        self._switch_mode("recent")
 
     def action_clear_or_quit(self) -> None:
         """Clear filter or quit if no filter."""
         filter_input = self.query_one("#filter-input", Input)
 
         if filter_input.display and filter_input.value:
-            # Clear filter
-            filter_input.value = ""
+            # Clear filter; prevent() stops the assignment from firing
+            # on_input_changed, which would schedule a second reload
+            with filter_input.prevent(Input.Changed):
+                filter_input.value = ""
             filter_input.display = False
             self.filter_text = ""
             if self.view_mode == "insights":
                 self._load_insights()
             else:
                 self._load_cards()
-            self.query_one("#browse-table", DataTable).focus()
+            self._table.focus()
         elif filter_input.display:
             # Just hide empty filter
             filter_input.display = False
-            self.query_one("#browse-table", DataTable).focus()
+            self._table.focus()
         else:
             # No filter active - quit
             self.app.exit()
@@ -272,6 +446,9 @@ class BrowseScreen(Screen):
 
     def _on_card_created(self, zettel_id: str) -> None:
         """Handle newly created card."""
+        self._mode_cache.clear()
+        self._last_filter = ""
+        self._last_filtered = []
         self._load_cards(self.filter_text)
         self.notify(f"Created {zettel_id}")
 
@@ -290,16 +467,17 @@ class BrowseScreen(Screen):
             else:
                 # Push main screen with this card
                 from zettel.screens.main import MainScreen
-                self.app.push_screen(MainScreen(initial_card=key))
+                self.app.push_screen(MainScreen(initial_card=key, db=self.db))
 
     def _show_cards_by_insight(self, insight_id: str) -> None:
         """Show cards filtered by a specific insight."""
-        table = self.query_one("#browse-table", DataTable)
+        table = self._table
 
         # Switch to cards view mode
         self.view_mode = "cards"
         self.card_mode = "insight"
-        self._setup_card_columns(table)
+        if self._current_columns != "cards":
+            self._setup_card_columns(table)
 
         # Get cards with this insight
         cards = self.db.get_cards_by_insight(insight_id)
@@ -316,31 +494,16 @@ class BrowseScreen(Screen):
         self.query_one("#browse-title", Static).update(f"[bold purple]#{insight_name}[/]")
         self.query_one("#browse-stats", Static).update(f"[dim]{len(cards)} notes[/]")
 
-        # Populate table
-        table.clear()
-        for card in cards:
-            preview = card['note'].replace('\n', ' ')[:45]
-            if len(card['note']) > 45:
-                preview += "..."
-
-            created = card['created_at'][:10] if card['created_at'] else ''
-
-            table.add_row(
-                card['zettel_id'],
-                preview,
-                str(card['connection_count']),
-                created,
-                key=card['zettel_id']
-            )
+        self._populate_table(table, cards)
 
         table.focus()
 
     def action_cursor_down(self) -> None:
         """Move cursor down (vim binding)."""
-        table = self.query_one("#browse-table", DataTable)
+        table = self._table
         table.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up (vim binding)."""
-        table = self.query_one("#browse-table", DataTable)
+        table = self._table
         table.action_cursor_up()
@@ -8,7 +8,7 @@ from textual.widgets import Static, Input, TextArea, Button
 from textual.containers import Vertical, Horizontal
 from textual.binding import Binding
 
-from zettel.utils import ZettelDB, get_char_status
+from zettel.utils import ZettelDB, dashboard_cache, get_char_status
 
 
 class CreateModal(ModalScreen):
@@ -26,6 +26,10 @@ class CreateModal(ModalScreen):
         Binding("escape", "cancel", "Cancel"),
     ]
 
+    # Seconds between char-count repaints while typing (counting itself
+    # stays per-keystroke so the incremental fast path sees every append)
+    COUNT_DEBOUNCE = 0.05
+
     def __init__(
         self,
         db: ZettelDB,
@@ -37,6 +41,16 @@ class CreateModal(ModalScreen):
         self.db = db
         self.on_created = on_created
         self.initial_id = initial_id
+        # Incremental counter state: the common keystroke is a one-char
+        # append, which updates the counts in O(1) instead of rescanning
+        self._last_text = ""
+        self._last_total = 0
+        self._last_effective = 0
+        self._trailing_ws = 0
+        self._has_bracket = False
+        self._last_status = None  # skip class churn while status is steady
+        self._count_timer = None
+        self._pending_counts = (0, 0, 'ok')
 
     def compose(self) -> ComposeResult:
         """Compose the create modal."""
@@ -69,24 +83,76 @@ class CreateModal(ModalScreen):
 
     def on_mount(self) -> None:
         """Initialize the modal."""
+        # Resolve widgets once; these never change after compose
+        self._id_input = self.query_one("#create-id-input", Input)
+        self._textarea = self.query_one("#create-textarea", TextArea)
+        self._links_input = self.query_one("#create-links-input", Input)
+        self._count_widget = self.query_one("#create-char-count", Static)
+
         self._update_char_count()
 
         # Focus the ID input first
-        id_input = self.query_one("#create-id-input", Input)
-        id_input.focus()
+        self._id_input.focus()
 
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
-        """Handle text changes in the content area."""
-        self._update_char_count()
+        """Handle text changes in the content area (display debounced)."""
+        # Count now - O(1) for plain appends - but repaint at most every
+        # COUNT_DEBOUNCE; the pending value is last-call-wins
+        self._pending_counts = self._count_chars(self._textarea.text)
+        if self._count_timer is None:
+            self._count_timer = self.set_timer(self.COUNT_DEBOUNCE, self._flush_count)
+
+    def _flush_count(self) -> None:
+        """Repaint the char count with the latest pending values."""
+        self._count_timer = None
+        self._render_char_count(*self._pending_counts)
+
+    def _count_chars(self, text: str) -> tuple[int, int, str]:
+        """Count chars incrementally for single-character appends.
+
+        Brackets make exclusion retroactive (typing ']' removes the whole
+        [...] run), so any text containing '[' falls back to the full scan
+        in get_char_status. Trailing whitespace is held back until a
+        non-space character lands, matching the strip() in the full count.
+        """
+        if (not self._has_bracket
+                and len(text) == self._last_total + 1
+                and text[-1] not in '[]'
+                and text.startswith(self._last_text)):
+            if text[-1].isspace():
+                self._trailing_ws += 1
+            elif self._last_effective:
+                self._last_effective += 1 + self._trailing_ws
+                self._trailing_ws = 0
+            else:
+                self._last_effective = 1
+                self._trailing_ws = 0
+
+            effective = self._last_effective
+            total = len(text)
+            if effective > 825:
+                status = 'over'
+            elif effective > 700:
+                status = 'warn'
+            else:
+                status = 'ok'
+        else:
+            effective, total, status = get_char_status(text)
+            self._last_effective = effective
+            self._has_bracket = '[' in text
+            self._trailing_ws = 0 if self._has_bracket else len(text) - len(text.rstrip())
 
-    def _update_char_count(self) -> None:
-        """Update the character count display."""
-        textarea = self.query_one("#create-textarea", TextArea)
-        text = textarea.text
+        self._last_text = text
+        self._last_total = total
+        return effective, total, status
 
-        effective, total, status = get_char_status(text)
+    def _update_char_count(self) -> None:
+        """Count and repaint immediately (initial render)."""
+        self._render_char_count(*self._count_chars(self._textarea.text))
 
-        count_widget = self.query_one("#create-char-count", Static)
+    def _render_char_count(self, effective: int, total: int, status: str) -> None:
+        """Update the character count display."""
+        count_widget = self._count_widget
 
         if status == 'over':
             style_class = "char-count-over"
@@ -105,8 +171,12 @@ class CreateModal(ModalScreen):
                 msg += f" [dim]({total} total)[/]"
 
         count_widget.update(msg)
-        count_widget.remove_class("char-count-ok", "char-count-warn", "char-count-over")
-        count_widget.add_class(style_class)
+        # Typing mostly stays in one color bucket; only touch classes on
+        # an actual transition
+        if status != self._last_status:
+            count_widget.remove_class("char-count-ok", "char-count-warn", "char-count-over")
+            count_widget.add_class(style_class)
+            self._last_status = status
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -118,13 +188,12 @@ class CreateModal(ModalScreen):
     def _do_create(self) -> None:
         """Attempt to create the card."""
         # Get values
-        id_input = self.query_one("#create-id-input", Input)
-        textarea = self.query_one("#create-textarea", TextArea)
-        links_input = self.query_one("#create-links-input", Input)
+        id_input = self._id_input
+        textarea = self._textarea
 
         zettel_id = id_input.value.strip()
         note = textarea.text.strip()
-        links_text = links_input.value.strip()
+        links_text = self._links_input.value.strip()
 
         # Validate ID
         if not zettel_id:
@@ -132,11 +201,6 @@ class CreateModal(ModalScreen):
             id_input.focus()
             return
 
-        if self.db.card_exists(zettel_id):
-            self.notify(f"Card {zettel_id} already exists", severity="error")
-            id_input.focus()
-            return
-
         # Validate content
         if not note:
             self.notify("Note content is required", severity="error")
@@ -152,22 +216,25 @@ class CreateModal(ModalScreen):
             textarea.focus()
             return
 
-        # Parse and validate links
-        link_to = []
-        if links_text:
-            for link_id in links_text.split():
-                if self.db.card_exists(link_id):
-                    link_to.append(link_id)
-                else:
-                    self.notify(f"Link target {link_id} not found", severity="warning")
-
-        # Create the card
-        if self.db.create_card(zettel_id, note, link_to):
-            self.dismiss()
-            if self.on_created:
-                self.on_created(zettel_id)
-        else:
+        # Existence check, link validation, and inserts run as one transaction
+        result = self.db.create_card_with_links(zettel_id, note, links_text.split())
+
+        if result.exists:
+            self.notify(f"Card {zettel_id} already exists", severity="error")
+            id_input.focus()
+            return
+
+        if not result.success:
             self.notify("Failed to create card", severity="error")
+            return
+
+        for link_id in result.missing_targets:
+            self.notify(f"Link target {link_id} not found", severity="warning")
+
+        dashboard_cache.clear()
+        self.dismiss()
+        if self.on_created:
+            self.on_created(zettel_id)
 
     def action_cancel(self) -> None:
         """Cancel and close the modal."""
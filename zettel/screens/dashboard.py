@@ -1,11 +1,13 @@
 """Dashboard screen showing Zettelkasten overview and stats."""
 
 import sqlite3
-from pathlib import Path
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, Button
 from textual.containers import Container, Vertical, Horizontal
+from textual import work
+
+from zettel.utils import ZettelDB, dashboard_cache
 
 
 class DashboardScreen(Screen):
@@ -15,37 +17,39 @@ class DashboardScreen(Screen):
         ("escape", "app.pop_screen", "Back"),
     ]
 
-    def __init__(self, db_path: Path, **kwargs):
+    def __init__(self, db: ZettelDB, **kwargs):
         super().__init__(**kwargs)
-        self.db_path = db_path
+        self.db = db
+        self.db_path = db.db_path
+        self._conn = None
 
     def compose(self) -> ComposeResult:
-        """Compose the dashboard."""
+        """Compose the dashboard (placeholders; stats stream in async)."""
         with Container(id="zettel-dashboard"):
             yield Static("Zettelkasten - Knowledge Network", id="dashboard-title")
 
             with Horizontal(id="stats-row"):
                 with Vertical(classes="stat-card"):
-                    yield Static(self._get_total_notes(), classes="stat-value")
+                    yield Static("\u2014", id="stat-total", classes="stat-value")
                     yield Static("Total Notes", classes="stat-label")
 
                 with Vertical(classes="stat-card"):
-                    yield Static(self._get_total_links(), classes="stat-value")
+                    yield Static("\u2014", id="stat-links", classes="stat-value")
                     yield Static("Total Links", classes="stat-label")
 
                 with Vertical(classes="stat-card"):
-                    yield Static(self._get_orphan_count(), classes="stat-value")
+                    yield Static("\u2014", id="stat-orphans", classes="stat-value")
                     yield Static("Orphans", classes="stat-label")
 
                 with Vertical(classes="stat-card"):
-                    yield Static(self._get_avg_connections(), classes="stat-value")
+                    yield Static("\u2014", id="stat-avg", classes="stat-value")
                     yield Static("Avg Connections", classes="stat-label")
 
             with Horizontal(id="main-layout"):
                 # Left column: Recent notes
                 with Vertical(id="recent-column", classes="column"):
                     yield Static("Recent Notes", classes="section-title")
-                    yield Static(self._get_recent_notes(), id="recent-notes")
+                    yield Static("\u2014", id="recent-notes")
 
                 # Middle column: Quick actions
                 with Vertical(id="actions-column", classes="column"):
@@ -62,128 +66,118 @@ class DashboardScreen(Screen):
                 # Right column: Hub notes
                 with Vertical(id="hubs-column", classes="column"):
                     yield Static("Hub Notes (Most Connected)", classes="section-title")
-                    yield Static(self._get_hub_notes(), id="hub-notes")
-
-    def _get_connection(self):
-        """Get database connection."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+                    yield Static("\u2014", id="hub-notes")
 
-    def _get_total_notes(self) -> str:
-        """Get total note count."""
-        conn = self._get_connection()
-        count = conn.execute("SELECT COUNT(*) FROM zettelkasten").fetchone()[0]
-        conn.close()
-        return str(count)
+    def on_mount(self) -> None:
+        """Kick off the stat load; the first frame paints immediately."""
+        self._load_stats()
 
-    def _get_total_links(self) -> str:
-        """Get total link count."""
+    def _get_connection(self):
+        """Get the dashboard's shared database connection (created lazily)."""
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._conn = conn
+        return self._conn
+
+    def on_unmount(self) -> None:
+        """Close the shared connection when the screen goes away."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @work(exclusive=True, thread=True, group="dashboard-load")
+    def _load_stats(self) -> None:
+        """Fetch every dashboard value off the event loop, counts in one query."""
         conn = self._get_connection()
-        count = conn.execute("SELECT COUNT(*) FROM zettel_links").fetchone()[0]
-        conn.close()
-        return str(count)
 
-    def _get_orphan_count(self) -> str:
-        """Get orphan count."""
-        conn = self._get_connection()
-        count = conn.execute("""
-            SELECT COUNT(*) FROM zettelkasten z
-            WHERE z.zettel_id NOT IN (
-                SELECT from_zettel_id FROM zettel_links
-                UNION
-                SELECT to_zettel_id FROM zettel_links
+        # Serve pre-rendered values while the data is unchanged
+        stamp = dashboard_cache.stamp(conn)
+        values = dashboard_cache.get("dashboard", stamp)
+
+        if values is None:
+            total_notes, total_links, orphans = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM zettelkasten),
+                    (SELECT COUNT(*) FROM zettel_links),
+                    (SELECT COUNT(*) FROM zettelkasten WHERE conn_count = 0)
+            """).fetchone()
+
+            if total_notes == 0:
+                avg = "0.0"
+                # Empty box: skip the panel queries, the counts already told us
+                recent = "No notes yet.\n\nCreate your first note!"
+                hubs = "No notes yet."
+            else:
+                avg = f"{(total_links * 2) / total_notes:.1f}"
+                recent = self._fetch_recent_notes(conn)
+                hubs = self._fetch_hub_notes(conn)
+
+            values = (str(total_notes), str(total_links), str(orphans),
+                      avg, recent, hubs)
+            dashboard_cache.put("dashboard", stamp, values)
+
+        self.app.call_from_thread(self._apply_stats, values)
+
+    def _apply_stats(self, values: tuple) -> None:
+        """Fill the placeholder widgets (runs on the UI thread)."""
+        total, links, orphans, avg, recent, hubs = values
+        self.query_one("#stat-total", Static).update(total)
+        self.query_one("#stat-links", Static).update(links)
+        self.query_one("#stat-orphans", Static).update(orphans)
+        self.query_one("#stat-avg", Static).update(avg)
+        self.query_one("#recent-notes", Static).update(recent)
+        self.query_one("#hub-notes", Static).update(hubs)
+
+    def _fetch_recent_notes(self, conn) -> str:
+        """Get recent notes, rendered as one string by SQLite."""
+        row = conn.execute("""
+            SELECT group_concat(
+                printf('%-12s (%2d links)', zettel_id, conn_count)
+                    || CHAR(10) || '  ' || snippet
+                    || CASE WHEN full_len > 60 THEN '...' ELSE '' END,
+                CHAR(10) || CHAR(10))
+            FROM (
+                SELECT
+                    zettel_id,
+                    SUBSTR(REPLACE(note, CHAR(10), ' '), 1, 60) as snippet,
+                    LENGTH(note) as full_len,
+                    conn_count
+                FROM zettelkasten
+                ORDER BY created_at DESC
+                LIMIT 10
             )
-        """).fetchone()[0]
-        conn.close()
-        return str(count)
-
-    def _get_avg_connections(self) -> str:
-        """Get average connections per note."""
-        conn = self._get_connection()
-        total_notes = conn.execute("SELECT COUNT(*) FROM zettelkasten").fetchone()[0]
-        total_links = conn.execute("SELECT COUNT(*) FROM zettel_links").fetchone()[0]
-        conn.close()
-
-        if total_notes == 0:
-            return "0.0"
-
-        avg = (total_links * 2) / total_notes
-        return f"{avg:.1f}"
+        """).fetchone()
+
+        return row[0] or "No notes yet.\n\nCreate your first note!"
+
+    def _fetch_hub_notes(self, conn) -> str:
+        """Get hub notes (most connected), rendered as one string by SQLite."""
+        row = conn.execute("""
+            SELECT group_concat(
+                printf('%-12s (%2d links)', zettel_id, conn_count)
+                    || CHAR(10) || '  ' || snippet
+                    || CASE WHEN full_len > 50 THEN '...' ELSE '' END,
+                CHAR(10) || CHAR(10))
+            FROM (
+                SELECT
+                    zettel_id,
+                    SUBSTR(REPLACE(note, CHAR(10), ' '), 1, 50) as snippet,
+                    LENGTH(note) as full_len,
+                    conn_count
+                FROM zettelkasten
+                WHERE conn_count > 0
+                ORDER BY conn_count DESC
+                LIMIT 10
+            )
+        """).fetchone()
 
-    def _get_recent_notes(self) -> str:
-        """Get recent notes."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT
-                z.zettel_id,
-                z.note,
-                (
-                    SELECT COUNT(*) FROM zettel_links WHERE from_zettel_id = z.zettel_id
-                ) + (
-                    SELECT COUNT(*) FROM zettel_links WHERE to_zettel_id = z.zettel_id
-                ) as connection_count
-            FROM zettelkasten z
-            ORDER BY z.created_at DESC
-            LIMIT 10
-        """)
-
-        notes = cursor.fetchall()
-        conn.close()
-
-        if not notes:
-            return "No notes yet.\n\nCreate your first note!"
-
-        lines = []
-        for note in notes:
-            text = note['note'].replace('\n', ' ')[:60]
-            if len(note['note']) > 60:
-                text += "..."
-            lines.append(f"{note['zettel_id']:12} ({note['connection_count']:2} links)")
-            lines.append(f"  {text}")
-            lines.append("")
-
-        return "\n".join(lines)
-
-    def _get_hub_notes(self) -> str:
-        """Get hub notes (most connected)."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT
-                z.zettel_id,
-                z.note,
-                (
-                    SELECT COUNT(*) FROM zettel_links WHERE from_zettel_id = z.zettel_id
-                ) + (
-                    SELECT COUNT(*) FROM zettel_links WHERE to_zettel_id = z.zettel_id
-                ) as connection_count
-            FROM zettelkasten z
-            ORDER BY connection_count DESC
-            LIMIT 10
-        """)
-
-        hubs = cursor.fetchall()
-        conn.close()
-
-        if not hubs:
-            return "No notes yet."
-
-        lines = []
-        for hub in hubs:
-            if hub['connection_count'] == 0:
-                continue
-            text = hub['note'].replace('\n', ' ')[:50]
-            if len(hub['note']) > 50:
-                text += "..."
-            lines.append(f"{hub['zettel_id']:12} ({hub['connection_count']:2} links)")
-            lines.append(f"  {text}")
-            lines.append("")
-
-        return "\n".join(lines) if lines else "No connected notes yet."
+        return row[0] or "No connected notes yet."
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -8,7 +8,7 @@ from textual.widgets import Static, Input, Button
 from textual.containers import Vertical, Horizontal
 from textual.binding import Binding
 
-from zettel.utils import ZettelDB
+from zettel.utils import ZettelDB, dashboard_cache
 
 
 class LinkModal(ModalScreen):
@@ -27,6 +27,9 @@ class LinkModal(ModalScreen):
         Binding("enter", "submit", "Submit", show=False),
     ]
 
+    # Seconds to wait after the last keystroke before rebuilding the preview
+    PREVIEW_DEBOUNCE = 0.08
+
     def __init__(
         self,
         from_id: str,
@@ -38,6 +41,7 @@ class LinkModal(ModalScreen):
         self.from_id = from_id
         self.db = db
         self.on_linked = on_linked
+        self._preview_timer = None
 
     def compose(self) -> ComposeResult:
         """Compose the link modal."""
@@ -65,20 +69,28 @@ class LinkModal(ModalScreen):
                 yield Button("Cancel", id="btn-cancel")
 
     def on_mount(self) -> None:
-        """Focus the target input."""
-        target_input = self.query_one("#link-target-input", Input)
-        target_input.focus()
+        """Cache widget lookups and focus the target input."""
+        # Resolve widgets once; these never change after compose
+        self._target_input = self.query_one("#link-target-input", Input)
+        self._reason_input = self.query_one("#link-reason-input", Input)
+        self._preview = self.query_one("#link-preview", Static)
+
+        self._target_input.focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Update preview as user types."""
-        self._update_preview()
+        """Update preview as user types (debounced)."""
+        # Only the last keystroke in a burst rebuilds the preview
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(self.PREVIEW_DEBOUNCE, self._update_preview)
 
     def _update_preview(self) -> None:
         """Update the preview display."""
-        target = self.query_one("#link-target-input", Input).value.strip()
-        reason = self.query_one("#link-reason-input", Input).value.strip()
+        self._preview_timer = None
+        target = self._target_input.value.strip()
+        reason = self._reason_input.value.strip()
 
-        preview = self.query_one("#link-preview", Static)
+        preview = self._preview
 
         if target and reason:
             preview.update(f"[dim]Will append:[/]\n[gold1]→{target}: {reason}[/]")
@@ -100,38 +112,41 @@ class LinkModal(ModalScreen):
 
     def _do_link(self) -> None:
         """Attempt to create the annotated link."""
-        target = self.query_one("#link-target-input", Input).value.strip()
-        reason = self.query_one("#link-reason-input", Input).value.strip()
+        target = self._target_input.value.strip()
+        reason = self._reason_input.value.strip()
 
         # Validate target
         if not target:
             self.notify("Target card ID is required", severity="error")
-            self.query_one("#link-target-input", Input).focus()
+            self._target_input.focus()
             return
 
         if target == self.from_id:
             self.notify("Cannot link to self", severity="error")
-            self.query_one("#link-target-input", Input).focus()
+            self._target_input.focus()
             return
 
-        if not self.db.card_exists(target):
+        # Target existence and duplicate link checked in one round-trip
+        target_exists, link_exists = self.db.validate_link(self.from_id, target)
+
+        if not target_exists:
             self.notify(f"Card {target} not found", severity="error")
-            self.query_one("#link-target-input", Input).focus()
+            self._target_input.focus()
             return
 
         # Validate reason (REQUIRED)
         if not reason:
             self.notify("Reason is required - why does this connect?", severity="error")
-            self.query_one("#link-reason-input", Input).focus()
+            self._reason_input.focus()
             return
 
-        # Check for existing link (uses proper DB method, no connection leak)
-        if self.db.link_exists(self.from_id, target):
+        if link_exists:
             self.notify(f"Link to {target} already exists", severity="error")
             return
 
         # Create the annotated link
         if self.db.append_link_annotation(self.from_id, target, reason):
+            dashboard_cache.clear()
             self.dismiss()
             if self.on_linked:
                 self.on_linked(self.from_id, target)
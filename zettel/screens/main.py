@@ -5,10 +5,17 @@ from textual.screen import Screen
 from textual.widgets import Static, Footer
 from textual.containers import Horizontal, Vertical
 from textual.binding import Binding
+from textual import work
 
 from zettel.widgets.trail_panel import TrailPanel
 from zettel.widgets.card_panel import CardPanel
 from zettel.widgets.links_panel import LinksPanel
+from zettel.screens.browse_screen import BrowseScreen
+from zettel.screens.create_modal import CreateModal
+from zettel.screens.link_modal import LinkModal
+from zettel.screens.paths_modal import PathsModal
+from zettel.screens.search_modal import SearchModal
+from zettel.screens.tag_modal import TagModal
 from zettel.utils import SessionTrail, ZettelDB
 
 
@@ -39,18 +46,13 @@ class MainScreen(Screen):
     """
 
     BINDINGS = [
-        # Link jumping (1-6)
-        Binding("1", "jump_1", "Link 1", show=False),
-        Binding("2", "jump_2", "Link 2", show=False),
-        Binding("3", "jump_3", "Link 3", show=False),
-        Binding("4", "jump_4", "Link 4", show=False),
-        Binding("5", "jump_5", "Link 5", show=False),
-        Binding("6", "jump_6", "Link 6", show=False),
+        # Link jumping (1-6) routes to the one parameterized action
+        *[Binding(str(n), f"jump({n})", f"Link {n}", show=False) for n in range(1, 7)],
         # Trail navigation
         Binding("backspace", "go_back", "Back", show=True),
         Binding("backslash", "go_forward", "Fwd", show=True),
-        Binding("left", "trail_older", "← Page", show=False),
-        Binding("right", "trail_newer", "→ Page", show=False),
+        Binding("left,left_square_bracket", "trail_older", "← Page", show=False),
+        Binding("right,right_square_bracket", "trail_newer", "→ Page", show=False),
         Binding("tab", "focus_trail", "Trail", show=True),
         # Other actions
         Binding("escape", "back_to_browser", "Browser"),
@@ -63,10 +65,10 @@ class MainScreen(Screen):
         Binding("q", "quit", "Quit"),
     ]
 
-    def __init__(self, initial_card: str = None, **kwargs):
+    def __init__(self, initial_card: str = None, db: ZettelDB = None, **kwargs):
         super().__init__(**kwargs)
         self.trail = SessionTrail()  # Window size set dynamically by TrailPanel
-        self.db = ZettelDB()
+        self.db = db or ZettelDB()
         self._current_card: str | None = None
         self._initial_card: str | None = initial_card
 
@@ -84,16 +86,24 @@ class MainScreen(Screen):
 
     def on_mount(self) -> None:
         """Initialize the screen."""
+        # Resolve the three panels once; they live as long as the screen
+        self._card_panel = self.query_one("#card-widget", CardPanel)
+        self._links_panel = self.query_one("#links-widget", LinksPanel)
+        self._trail_panel = self.query_one("#trail-widget", TrailPanel)
+
+        # Pre-bound methods for the checkout hot path, which runs on every
+        # navigation key; skips re-creating the bound method each call
+        self._load_card = self._card_panel.load_card
+        self._load_links = self._links_panel.load_links
+        self._trail_checkout = self._trail_panel.checkout
+
         if self._initial_card:
             # Load the initial card directly
             self.checkout_card(self._initial_card)
         else:
             # Show welcome state
-            card_panel = self.query_one("#card-widget", CardPanel)
-            card_panel.clear()
-
-            links_panel = self.query_one("#links-widget", LinksPanel)
-            links_panel.clear()
+            self._card_panel.clear()
+            self._links_panel.clear()
 
     def checkout_card(self, zettel_id: str) -> bool:
         """
@@ -101,47 +111,23 @@ class MainScreen(Screen):
 
         Returns True if card was found.
         """
-        card_panel = self.query_one("#card-widget", CardPanel)
-        links_panel = self.query_one("#links-widget", LinksPanel)
-        trail_panel = self.query_one("#trail-widget", TrailPanel)
-
         # Try to load the card
-        if not card_panel.load_card(zettel_id):
+        if not self._load_card(zettel_id):
             self.notify(f"Card {zettel_id} not found", severity="error")
             return False
 
         # Update links panel
-        links_panel.load_links(zettel_id)
+        self._load_links(zettel_id)
 
         # Add to trail
-        trail_panel.checkout(zettel_id)
+        self._trail_checkout(zettel_id)
 
         self._current_card = zettel_id
         return True
 
-    # Link jumping actions
-    def action_jump_1(self) -> None:
-        self._jump_to_link(1)
-
-    def action_jump_2(self) -> None:
-        self._jump_to_link(2)
-
-    def action_jump_3(self) -> None:
-        self._jump_to_link(3)
-
-    def action_jump_4(self) -> None:
-        self._jump_to_link(4)
-
-    def action_jump_5(self) -> None:
-        self._jump_to_link(5)
-
-    def action_jump_6(self) -> None:
-        self._jump_to_link(6)
-
-    def _jump_to_link(self, num: int) -> None:
+    def action_jump(self, num: int) -> None:
         """Jump to a numbered link."""
-        links_panel = self.query_one("#links-widget", LinksPanel)
-        zettel_id = links_panel.get_link_by_number(num)
+        zettel_id = self._links_panel.get_link_by_number(num)
         if zettel_id:
             self.checkout_card(zettel_id)
         else:
@@ -150,15 +136,13 @@ class MainScreen(Screen):
     # Trail navigation actions
     def action_trail_older(self) -> None:
         """Page trail to show older entries."""
-        trail_panel = self.query_one("#trail-widget", TrailPanel)
         if self.trail.page_older():
-            trail_panel.refresh_trail()
+            self._trail_panel.refresh_trail()
 
     def action_trail_newer(self) -> None:
         """Page trail to show newer entries."""
-        trail_panel = self.query_one("#trail-widget", TrailPanel)
         if self.trail.page_newer():
-            trail_panel.refresh_trail()
+            self._trail_panel.refresh_trail()
 
     def action_back_to_browser(self) -> None:
         """Return to the browse screen."""
@@ -166,17 +150,13 @@ class MainScreen(Screen):
 
     def _load_card_without_trail(self, zettel_id: str) -> None:
         """Load a card without adding to trail (for trail jumps)."""
-        card_panel = self.query_one("#card-widget", CardPanel)
-        links_panel = self.query_one("#links-widget", LinksPanel)
-
-        if card_panel.load_card(zettel_id):
-            links_panel.load_links(zettel_id)
+        if self._load_card(zettel_id):
+            self._load_links(zettel_id)
             self._current_card = zettel_id
 
     def action_go_back(self) -> None:
         """Go back in the trail."""
-        trail_panel = self.query_one("#trail-widget", TrailPanel)
-        zettel_id = trail_panel.go_back()
+        zettel_id = self._trail_panel.go_back()
         if zettel_id:
             self._load_card_without_trail(zettel_id)
         else:
@@ -184,8 +164,7 @@ class MainScreen(Screen):
 
     def action_go_forward(self) -> None:
         """Go forward in the trail."""
-        trail_panel = self.query_one("#trail-widget", TrailPanel)
-        zettel_id = trail_panel.go_forward()
+        zettel_id = self._trail_panel.go_forward()
         if zettel_id:
             self._load_card_without_trail(zettel_id)
         else:
@@ -193,19 +172,16 @@ class MainScreen(Screen):
 
     def action_focus_trail(self) -> None:
         """Focus the trail panel for keyboard navigation."""
-        trail_panel = self.query_one("#trail-widget", TrailPanel)
-        trail_panel.focus()
+        self._trail_panel.focus()
 
     def on_trail_panel_trail_selected(self, message: TrailPanel.TrailSelected) -> None:
         """Handle trail entry selection from focused trail panel."""
         self._load_card_without_trail(message.zettel_id)
         # Keep trail panel display updated
-        trail_panel = self.query_one("#trail-widget", TrailPanel)
-        trail_panel.refresh_trail()
+        self._trail_panel.refresh_trail()
 
     def action_new_card(self) -> None:
         """Open the new card modal."""
-        from zettel.screens.create_modal import CreateModal
         self.app.push_screen(CreateModal(db=self.db, on_created=self._on_card_created))
 
     def action_add_link(self) -> None:
@@ -214,7 +190,6 @@ class MainScreen(Screen):
             self.notify("No card selected")
             return
 
-        from zettel.screens.link_modal import LinkModal
         self.app.push_screen(LinkModal(
             from_id=self._current_card,
             db=self.db,
@@ -227,7 +202,6 @@ class MainScreen(Screen):
             self.notify("No card selected")
             return
 
-        from zettel.screens.tag_modal import TagModal
         self.app.push_screen(TagModal(
             zettel_id=self._current_card,
             db=self.db,
@@ -237,18 +211,15 @@ class MainScreen(Screen):
     def _on_tags_changed(self) -> None:
         """Handle tag changes - refresh the card display."""
         if self._current_card:
-            card_panel = self.query_one("#card-widget", CardPanel)
-            card_panel.load_card(self._current_card)
+            self._card_panel.load_card(self._current_card)
 
     def _on_link_created(self, from_id: str, to_id: str) -> None:
         """Handle a newly created link - refresh the card display."""
         # Reload current card to show the appended annotation
-        card_panel = self.query_one("#card-widget", CardPanel)
-        card_panel.load_card(from_id)
+        self._card_panel.load_card(from_id)
 
         # Refresh links panel to show new outbound link
-        links_panel = self.query_one("#links-widget", LinksPanel)
-        links_panel.load_links(from_id)
+        self._links_panel.load_links(from_id)
 
         self.notify(f"Linked {from_id} → {to_id}", severity="information")
 
@@ -263,7 +234,6 @@ class MainScreen(Screen):
             self.notify("No card selected")
             return
 
-        from zettel.screens.paths_modal import PathsModal
         self.app.push_screen(PathsModal(
             zettel_id=self._current_card,
             db=self.db,
@@ -272,12 +242,14 @@ class MainScreen(Screen):
 
     def _on_path_selected(self, path: list[str]) -> None:
         """Handle a path selection - walk the path."""
-        for zettel_id in path:
-            self.checkout_card(zettel_id)
+        # Intermediate hops only need to land in the trail; rendering the
+        # card and links panels for each would be thrown away immediately
+        for zettel_id in path[:-1]:
+            self._trail_panel.checkout(zettel_id)
+        self.checkout_card(path[-1])
 
     def action_search(self) -> None:
         """Open search overlay."""
-        from zettel.screens.search_modal import SearchModal
         self.app.push_screen(SearchModal(
             db=self.db,
             on_selected=self.checkout_card
@@ -285,7 +257,6 @@ class MainScreen(Screen):
 
     def action_browse(self) -> None:
         """Open browse screen."""
-        from zettel.screens.browse_screen import BrowseScreen
         self.app.push_screen(BrowseScreen(
             db=self.db,
             mode="all",
@@ -294,7 +265,6 @@ class MainScreen(Screen):
 
     def action_show_hubs(self) -> None:
         """Show hub cards."""
-        from zettel.screens.browse_screen import BrowseScreen
         self.app.push_screen(BrowseScreen(
             db=self.db,
             mode="hubs",
@@ -303,17 +273,18 @@ class MainScreen(Screen):
 
     def action_show_orphans(self) -> None:
         """Show orphan cards."""
-        from zettel.screens.browse_screen import BrowseScreen
         self.app.push_screen(BrowseScreen(
             db=self.db,
             mode="orphans",
             on_selected=self.checkout_card
         ))
 
+    @work(exclusive=True, thread=True, group="stats-load")
     def action_show_stats(self) -> None:
-        """Show Zettelkasten statistics."""
+        """Show Zettelkasten statistics (queried off the event loop)."""
         stats = self.db.get_stats()
-        self.notify(
+        self.app.call_from_thread(
+            self.notify,
             f"Notes: {stats['total_notes']}  |  "
             f"Links: {stats['total_links']}  |  "
             f"Orphans: {stats['orphan_count']}  |  "
@@ -329,16 +300,3 @@ class MainScreen(Screen):
         """Handle link jump message."""
         self.checkout_card(message.zettel_id)
 
-    def on_key(self, event) -> None:
-        """Handle key events for trail paging."""
-        if event.key == "[" or event.key == "bracketleft":
-            trail_panel = self.query_one("#trail-widget", TrailPanel)
-            if self.trail.page_older():
-                trail_panel.refresh_trail()
-                event.stop()
-
-        elif event.key == "]" or event.key == "bracketright":
-            trail_panel = self.query_one("#trail-widget", TrailPanel)
-            if self.trail.page_newer():
-                trail_panel.refresh_trail()
-                event.stop()
@@ -7,6 +7,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Static
 from textual.containers import Vertical, VerticalScroll
 from textual.binding import Binding
+from textual import work
 
 from zettel.utils import ZettelDB
 
@@ -21,15 +22,8 @@ class PathsModal(ModalScreen):
 
     BINDINGS = [
         Binding("escape", "dismiss", "Close"),
-        Binding("1", "select_1", "", show=False),
-        Binding("2", "select_2", "", show=False),
-        Binding("3", "select_3", "", show=False),
-        Binding("4", "select_4", "", show=False),
-        Binding("5", "select_5", "", show=False),
-        Binding("6", "select_6", "", show=False),
-        Binding("7", "select_7", "", show=False),
-        Binding("8", "select_8", "", show=False),
-        Binding("9", "select_9", "", show=False),
+        # Digits 1-9 all route to the one parameterized action
+        *[Binding(str(n), f"select({n})", "", show=False) for n in range(1, 10)],
     ]
 
     def __init__(
@@ -56,8 +50,19 @@ class PathsModal(ModalScreen):
             yield Static("[1-9] Walk path  [Esc] Close", id="paths-help")
 
     def on_mount(self) -> None:
-        """Load paths on mount."""
-        self.paths = self.db.get_paths(self.zettel_id, limit=9)
+        """Kick off the path query; the modal paints immediately."""
+        self.query_one("#paths-content", Static).update("[dim]Finding paths...[/]")
+        self._load_paths()
+
+    @work(exclusive=True, thread=True, group="paths-load")
+    def _load_paths(self) -> None:
+        """Run the 2-hop query off the event loop."""
+        paths = self.db.get_paths(self.zettel_id, limit=9)
+        self.app.call_from_thread(self._apply_paths, paths)
+
+    def _apply_paths(self, paths: list[dict]) -> None:
+        """Store the paths and render them (runs on the UI thread)."""
+        self.paths = paths
         self._update_display()
 
     def _update_display(self) -> None:
@@ -68,22 +73,23 @@ class PathsModal(ModalScreen):
             content.update("[dim]No 2-hop paths found from this card.[/]")
             return
 
-        lines = []
+        blocks = []
         for i, path in enumerate(self.paths, 1):
             hop1_id = path['hop1_id']
             hop2_id = path['hop2_id']
-            hop2_preview = path['hop2_note'].replace('\n', ' ')[:50]
+            # Slice before replacing; replace is 1:1 so only the first 50
+            # chars matter, not the whole note
+            hop2_preview = path['hop2_note'][:50].replace('\n', ' ')
 
-            lines.append(
+            blocks.append(
                 f"[cyan bold][{i}][/] [#d4a574]{self.zettel_id}[/] → "
-                f"[#d4a574]{hop1_id}[/] → [#d4a574]{hop2_id}[/]"
+                f"[#d4a574]{hop1_id}[/] → [#d4a574]{hop2_id}[/]\n"
+                f"    [dim]└─ {hop2_preview}...[/]"
             )
-            lines.append(f"    [dim]└─ {hop2_preview}...[/]")
-            lines.append("")
 
-        content.update("\n".join(lines))
+        content.update("\n\n".join(blocks))
 
-    def _select_path(self, num: int) -> None:
+    def action_select(self, num: int) -> None:
         """Select and walk a path."""
         if 1 <= num <= len(self.paths):
             path = self.paths[num - 1]
@@ -92,30 +98,3 @@ class PathsModal(ModalScreen):
             self.dismiss()
             if self.on_path_selected:
                 self.on_path_selected(path_ids)
-
-    def action_select_1(self) -> None:
-        self._select_path(1)
-
-    def action_select_2(self) -> None:
-        self._select_path(2)
-
-    def action_select_3(self) -> None:
-        self._select_path(3)
-
-    def action_select_4(self) -> None:
-        self._select_path(4)
-
-    def action_select_5(self) -> None:
-        self._select_path(5)
-
-    def action_select_6(self) -> None:
-        self._select_path(6)
-
-    def action_select_7(self) -> None:
-        self._select_path(7)
-
-    def action_select_8(self) -> None:
-        self._select_path(8)
-
-    def action_select_9(self) -> None:
-        self._select_path(9)
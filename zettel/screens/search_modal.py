@@ -1,5 +1,6 @@
 """Search Modal - Quick search overlay."""
 
+from collections import OrderedDict
 from typing import Callable
 
 from textual.app import ComposeResult
@@ -7,6 +8,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Static, Input, DataTable
 from textual.containers import Vertical
 from textual.binding import Binding
+from textual import work
 
 from zettel.utils import ZettelDB
 
@@ -25,6 +27,9 @@ class SearchModal(ModalScreen):
         Binding("escape", "dismiss", "Close"),
     ]
 
+    # Seconds to wait after the last keystroke before querying
+    SEARCH_DEBOUNCE = 0.15
+
     def __init__(
         self,
         db: ZettelDB,
@@ -34,6 +39,10 @@ class SearchModal(ModalScreen):
         super().__init__(**kwargs)
         self.db = db
         self.on_selected = on_selected
+        self._search_timer = None
+        self._pending_query = ""
+        # LRU of recent results so backspacing through prefixes is free
+        self._result_cache: OrderedDict[str, list[dict]] = OrderedDict()
 
     def compose(self) -> ComposeResult:
         """Compose the search modal."""
@@ -56,29 +65,107 @@ class SearchModal(ModalScreen):
         search_input.focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
+        """Handle search input changes (debounced)."""
         query = event.value.strip()
 
-        table = self.query_one("#search-table", DataTable)
-        table.clear()
-
         if len(query) < 2:
+            if self._search_timer is not None:
+                self._search_timer.stop()
+                self._search_timer = None
+            # Invalidate the pending query and stop any in-flight search so
+            # late-arriving batches can't repopulate the cleared table
+            self._pending_query = ""
+            self.workers.cancel_group(self, "search")
+            self.query_one("#search-table", DataTable).clear()
             return
 
-        # Search and populate results
-        results = self.db.search_cards(query, limit=20)
+        # Only the last keystroke in a burst issues a query
+        self._pending_query = query
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(self.SEARCH_DEBOUNCE, self._search_pending)
 
-        for card in results:
-            preview = card['note'].replace('\n', ' ')[:45]
-            if len(card['note']) > 45:
-                preview += "..."
+    # Entries kept in the per-modal result LRU
+    CACHE_SIZE = 128
+
+    def _search_pending(self) -> None:
+        """Fire the query for the last debounced keystroke."""
+        self._search_timer = None
+        query = self._pending_query
+
+        cached = self._result_cache.get(query)
+        if cached is not None:
+            self._result_cache.move_to_end(query)
+            self._apply_results(cached)
+            return
+
+        self._run_search(query)
+
+    # Rows shown per streaming step; the first batch paints almost
+    # immediately while the rest of the scan continues
+    STREAM_BATCH = 5
+
+    @work(exclusive=True, thread=True, group="search")
+    def _run_search(self, query: str) -> None:
+        """Run the search off the event loop, streaming rows as they arrive."""
+        results: list[dict] = []
+        batch: list[dict] = []
+        first = True
+
+        for card in self.db.iter_search_cards(query, limit=20):
+            results.append(card)
+            batch.append(card)
+            if len(batch) == self.STREAM_BATCH:
+                self.app.call_from_thread(self._stream_rows, query, batch, first)
+                batch = []
+                first = False
+
+        if batch or first:
+            self.app.call_from_thread(self._stream_rows, query, batch, first)
+        self.app.call_from_thread(self._cache_results, query, results)
+
+    def _stream_rows(self, query: str, batch: list[dict], clear_first: bool) -> None:
+        """Append a batch of result rows (runs on the UI thread)."""
+        # A newer query may already be pending; drop stale batches
+        if query != self._pending_query:
+            return
+
+        table = self.query_one("#search-table", DataTable)
+        if clear_first:
+            table.clear()
+        for card in batch:
+            self._add_result_row(table, card)
+
+    def _cache_results(self, query: str, results: list[dict]) -> None:
+        """Remember a fresh result set, evicting the oldest past the cap."""
+        self._result_cache[query] = results
+        if len(self._result_cache) > self.CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _apply_results(self, results: list[dict]) -> None:
+        """Populate the results table from a full result set (cache hits)."""
+        table = self.query_one("#search-table", DataTable)
 
-            table.add_row(
-                card['zettel_id'],
-                preview,
-                str(card['connection_count']),
-                key=card['zettel_id']
-            )
+        # Keyed rows need one add_row call each; batch_update holds the
+        # repaint so the clear + refill paints as a single frame
+        with self.app.batch_update():
+            table.clear()
+            for card in results:
+                self._add_result_row(table, card)
+
+    @staticmethod
+    def _add_result_row(table: DataTable, card: dict) -> None:
+        """Add one search result to the table."""
+        preview = card['note'].replace('\n', ' ')[:45]
+        if len(card['note']) > 45:
+            preview += "..."
+
+        table.add_row(
+            card['zettel_id'],
+            preview,
+            str(card['connection_count']),
+            key=card['zettel_id']
+        )
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle result selection."""
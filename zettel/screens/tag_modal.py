@@ -8,6 +8,7 @@ from textual.widgets import Static, Input, Button, ListView, ListItem, Label
 from textual.containers import Vertical, Horizontal, ScrollableContainer
 from textual.binding import Binding
 from textual.reactive import reactive
+from textual import work
 
 from zettel.utils import ZettelDB
 
@@ -45,8 +46,12 @@ class TagModal(ModalScreen):
         self.db = db
         self.on_changed = on_changed
         self._current_tags: list[dict] = []
+        self._current_ids: set[str] = set()
         self._suggestions: list[dict] = []
         self._search_text: str = ""
+        self._all_insights: list[dict] = []
+        self._show_create: bool = False
+        self._last_render_key: tuple = None
 
     def compose(self) -> ComposeResult:
         """Compose the tag modal."""
@@ -63,23 +68,40 @@ class TagModal(ModalScreen):
             yield Static("Add or create:", id="tag-add-label")
             yield Input(placeholder="Type to search or create...", id="tag-input")
 
-            # Suggestions list
+            # Suggestions list (one Static, updated in place)
             with ScrollableContainer(id="tag-suggestions-container"):
-                yield Vertical(id="tag-suggestions")
+                yield Static("", id="tag-suggestions-text")
 
             # Buttons
             with Horizontal(id="tag-buttons"):
                 yield Button("Done", variant="primary", id="btn-done")
 
     def on_mount(self) -> None:
-        """Initialize the modal."""
-        self._load_current_tags()
-        self._load_suggestions("")
+        """Kick off the initial load; the modal paints immediately."""
+        self.query_one("#tag-suggestions-text", Static).update("[dim]Loading...[/]")
+        self._load_initial()
         self.query_one("#tag-input", Input).focus()
 
+    @work(exclusive=True, thread=True, group="tag-load")
+    def _load_initial(self) -> None:
+        """Fetch the insight list and current tags off the event loop."""
+        # Fetched once; creates while the modal is open update it in memory
+        all_insights = self.db.get_all_insights_simple()
+        current_tags = self.db.get_card_insights(self.zettel_id)
+        self.app.call_from_thread(self._apply_initial, all_insights, current_tags)
+
+    def _apply_initial(self, all_insights: list[dict], current_tags: list[dict]) -> None:
+        """Store the fetched lists and render (runs on the UI thread)."""
+        self._all_insights = all_insights
+        self._current_tags = current_tags
+        self._current_ids = {t['id'] for t in current_tags}
+        self._render_current_tags()
+        self._load_suggestions(self.query_one("#tag-input", Input).value)
+
     def _load_current_tags(self) -> None:
         """Load and display current tags for this card."""
         self._current_tags = self.db.get_card_insights(self.zettel_id)
+        self._current_ids = {t['id'] for t in self._current_tags}
         self._render_current_tags()
 
     def _render_current_tags(self) -> None:
@@ -90,14 +112,14 @@ class TagModal(ModalScreen):
         if not self._current_tags:
             container.mount(Static("[dim]No tags yet[/]", classes="tag-empty"))
         else:
+            # One button per tag (label + remove in one widget) instead of
+            # a container + label + button triple for each
             for tag in self._current_tags:
-                # Create a tag chip with remove button
-                chip = Horizontal(
-                    Static(f"[purple]{tag['name']}[/]", classes="tag-chip-name"),
-                    Button("×", id=f"remove-{tag['id']}", classes="tag-chip-remove"),
+                container.mount(Button(
+                    f"{tag['name']} ×",
+                    id=f"remove-{tag['id']}",
                     classes="tag-chip"
-                )
-                container.mount(chip)
+                ))
 
     def _load_suggestions(self, query: str) -> None:
         """Load suggestions based on search query."""
@@ -107,74 +129,78 @@ class TagModal(ModalScreen):
             # Search for matching insights
             all_insights = self.db.search_insights(self._search_text)
         else:
-            # Show all insights
-            all_insights = self.db.get_all_insights_simple()
+            # Show all insights (cached at mount)
+            all_insights = self._all_insights
 
-        # Filter out already-applied tags
-        current_ids = {t['id'] for t in self._current_tags}
+        # Filter out already-applied tags (set maintained by the tag loads)
+        current_ids = self._current_ids
         self._suggestions = [i for i in all_insights if i['id'] not in current_ids]
 
+        # Decide the "create new" row once per load; the render and the
+        # max-index math both used to rescan the list for an exact match
+        self._show_create = bool(self._search_text) and (
+            self._search_text.lower()
+            not in {i['name'].lower() for i in self._suggestions}
+        )
+
         # Reset selection
         self.selected_index = 0 if self._suggestions else -1
 
         self._render_suggestions()
 
     def _render_suggestions(self) -> None:
-        """Render the suggestions list."""
-        container = self.query_one("#tag-suggestions", Vertical)
-        container.remove_children()
+        """Render the suggestions list.
+
+        The list is one Static updated in place; mounting a widget per
+        suggestion on every keystroke made typing in the input lag.
+        """
+        # Identical inputs produce identical text; duplicate events and
+        # cursor bouncing skip the rebuild and the update entirely
+        key = (
+            tuple(i['id'] for i in self._suggestions),
+            self.selected_index,
+            self._search_text,
+        )
+        if key == self._last_render_key:
+            return
+        self._last_render_key = key
+
+        lines = []
 
         # Existing insights that match
         for i, insight in enumerate(self._suggestions):
-            is_selected = (i == self.selected_index)
-            prefix = "→ " if is_selected else "  "
-            style = "reverse" if is_selected else ""
-            item = Static(
-                f"{prefix}{insight['name']}",
-                id=f"suggestion-{i}",
-                classes=f"tag-suggestion {style}"
-            )
-            container.mount(item)
+            if i == self.selected_index:
+                lines.append(f"[reverse]→ {insight['name']}[/]")
+            else:
+                lines.append(f"  {insight['name']}")
 
         # "Create new" option if there's search text and no exact match
-        if self._search_text:
-            exact_match = any(
-                s['name'].lower() == self._search_text.lower()
-                for s in self._suggestions
-            )
-            if not exact_match:
-                create_index = len(self._suggestions)
-                is_selected = (self.selected_index == create_index)
-                prefix = "→ " if is_selected else "  "
-                style = "reverse" if is_selected else ""
-                create_item = Static(
-                    f'{prefix}[green]+ Create "{self._search_text}"[/]',
-                    id="suggestion-create",
-                    classes=f"tag-suggestion tag-create {style}"
-                )
-                container.mount(create_item)
+        if self._show_create:
+            if self.selected_index == len(self._suggestions):
+                lines.append(f'[reverse]→ [green]+ Create "{self._search_text}"[/][/]')
+            else:
+                lines.append(f'  [green]+ Create "{self._search_text}"[/]')
 
         if not self._suggestions and not self._search_text:
-            container.mount(Static("[dim]No insights yet. Type to create one.[/]", classes="tag-empty"))
+            lines.append("[dim]No insights yet. Type to create one.[/]")
+
+        self.query_one("#tag-suggestions-text", Static).update("\n".join(lines))
 
     def _get_max_index(self) -> int:
         """Get the maximum valid selection index."""
         max_idx = len(self._suggestions) - 1
 
         # Add 1 for "create new" if applicable
-        if self._search_text:
-            exact_match = any(
-                s['name'].lower() == self._search_text.lower()
-                for s in self._suggestions
-            )
-            if not exact_match:
-                max_idx += 1
+        if self._show_create:
+            max_idx += 1
 
         return max_idx
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
-        if event.input.id == "tag-input":
+        # Changed events that don't change the stripped query (leading or
+        # trailing spaces) would re-run the same search and re-render
+        if event.input.id == "tag-input" and event.value.strip() != self._search_text:
             self._load_suggestions(event.value)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -209,6 +235,8 @@ class TagModal(ModalScreen):
         insight_id = self.db.create_insight(name)
         if insight_id:
             self.db.add_insight_to_card(self.zettel_id, insight_id)
+            self._all_insights.append({'id': insight_id, 'name': name})
+            self._all_insights.sort(key=lambda i: i['name'])
             self._load_current_tags()
             # Clear input and reload suggestions
             self.query_one("#tag-input", Input).value = ""
@@ -221,8 +249,12 @@ class TagModal(ModalScreen):
         """Move to next suggestion."""
         max_idx = self._get_max_index()
         if max_idx >= 0:
-            self.selected_index = min(self.selected_index + 1, max_idx)
-            self._render_suggestions()
+            new_index = min(self.selected_index + 1, max_idx)
+            # Holding down at the end of the list clamps to the same index;
+            # nothing changed, so skip the re-render
+            if new_index != self.selected_index:
+                self.selected_index = new_index
+                self._render_suggestions()
 
     def action_prev_suggestion(self) -> None:
         """Move to previous suggestion."""
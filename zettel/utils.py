@@ -2,19 +2,44 @@
 
 import re
 import sqlite3
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Iterator
 
 from config import DB_PATH
 
+# Compiled once: [bracketed] spans excluded from effective char counts.
+# The negated class scans straight ahead with no lazy-quantifier
+# backtracking on inputs like '[[[['.
+_BRACKET_RE = re.compile(r'\[[^\]]*\]')
+_WS_RE = re.compile(r'\s+')
+_NONSLUG_RE = re.compile(r'[^a-z0-9\-]')
+# Queries made only of word characters can go through FTS prefix matching;
+# anything else (punctuation, partial-word substrings) falls back to LIKE
+_FTS_QUERY_RE = re.compile(r'\w+(?:\s+\w+)*')
 
-@dataclass
-class TrailEntry:
-    """A single entry in the session trail."""
+
+@dataclass(slots=True)
+class Card:
+    """A lightweight card row for list views.
+
+    Slot-based attribute access avoids the per-field name scan of
+    sqlite3.Row and the memory cost of dict rows in hot render loops.
+    """
     zettel_id: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    preview_raw: str
+    note_len: int
+    created_at: str
+    connection_count: int
+
+
+@dataclass(slots=True)
+class CreateResult:
+    """Outcome of create_card_with_links, granular enough to notify from."""
+    success: bool
+    exists: bool = False
+    missing_targets: list[str] = field(default_factory=list)
 
 
 class SessionTrail:
@@ -28,7 +53,10 @@ class SessionTrail:
     """
 
     def __init__(self, window_size: int = 20):
-        self.entries: list[TrailEntry] = []
+        # Parallel lists instead of per-entry objects: checkout is two
+        # appends, and the render path reads ids without attribute hops
+        self.ids: list[str] = []
+        self.ts: list[float] = []
         self.position: int = -1  # Current position in trail (-1 = empty)
         self.window_start: int = 0  # Display window start
         self.window_size: int = window_size  # Can be updated dynamically
@@ -36,14 +64,15 @@ class SessionTrail:
     @property
     def current(self) -> Optional[str]:
         """Get current zettel_id or None if empty."""
-        if 0 <= self.position < len(self.entries):
-            return self.entries[self.position].zettel_id
+        # position never exceeds len(ids) - 1; only the empty case needs a check
+        if self.position >= 0:
+            return self.ids[self.position]
         return None
 
     @property
     def total(self) -> int:
         """Total entries in trail."""
-        return len(self.entries)
+        return len(self.ids)
 
     @property
     def can_go_back(self) -> bool:
@@ -53,7 +82,7 @@ class SessionTrail:
     @property
     def can_go_forward(self) -> bool:
         """Can we go forward (after backtracking)?"""
-        return self.position < len(self.entries) - 1
+        return self.position < len(self.ids) - 1
 
     def checkout(self, zettel_id: str) -> None:
         """
@@ -66,8 +95,9 @@ class SessionTrail:
             return
 
         # Always append to end (no truncation - preserve full history)
-        self.entries.append(TrailEntry(zettel_id))
-        self.position = len(self.entries) - 1
+        self.ids.append(zettel_id)
+        self.ts.append(time.monotonic())
+        self.position = len(self.ids) - 1
 
         # Adjust window to show current
         self._adjust_window()
@@ -90,7 +120,7 @@ class SessionTrail:
 
         Returns the zettel_id we went to, or None if at end.
         """
-        if self.position < len(self.entries) - 1:
+        if self.position < len(self.ids) - 1:
             self.position += 1
             self._adjust_window()
             return self.current
@@ -107,7 +137,7 @@ class SessionTrail:
             The zettel_id jumped to, or None if invalid index.
         """
         actual_index = self.window_start + display_index - 1
-        if 0 <= actual_index < len(self.entries):
+        if 0 <= actual_index < len(self.ids):
             self.position = actual_index
             self._adjust_window()
             return self.current
@@ -121,15 +151,15 @@ class SessionTrail:
             List of (actual_position, zettel_id, is_current) tuples.
             actual_position is 1-based actual trail position (not window position).
         """
-        result = []
-        end = min(self.window_start + self.window_size, len(self.entries))
-
-        for i in range(self.window_start, end):
-            actual_pos = i + 1  # 1-based actual position in trail
-            is_current = (i == self.position)
-            result.append((actual_pos, self.entries[i].zettel_id, is_current))
+        start = self.window_start
+        end = min(start + self.window_size, len(self.ids))
+        position = self.position
 
-        return result
+        # Slice once and enumerate rather than indexing per row
+        return [
+            (i + 1, zid, i == position)
+            for i, zid in enumerate(self.ids[start:end], start=start)
+        ]
 
     def get_overflow_info(self) -> tuple[int, int]:
         """
@@ -139,9 +169,28 @@ class SessionTrail:
             (entries_before_window, entries_after_window)
         """
         before = self.window_start
-        after = max(0, len(self.entries) - (self.window_start + self.window_size))
+        after = max(0, len(self.ids) - (self.window_start + self.window_size))
         return (before, after)
 
+    def get_snapshot(self) -> tuple[list[tuple[int, str, bool]], int, int, int]:
+        """
+        Get the visible entries and trail totals in one call.
+
+        Returns:
+            (visible_entries, total, overflow_before, overflow_after),
+            matching get_visible_entries and get_overflow_info.
+        """
+        total = len(self.ids)
+        start = self.window_start
+        end = min(start + self.window_size, total)
+        position = self.position
+
+        entries = [
+            (i + 1, zid, i == position)
+            for i, zid in enumerate(self.ids[start:end], start=start)
+        ]
+        return (entries, total, start, max(0, total - (start + self.window_size)))
+
     def page_older(self) -> bool:
         """
         Page the window to show older entries.
@@ -159,7 +208,7 @@ class SessionTrail:
 
         Returns True if window moved.
         """
-        max_start = max(0, len(self.entries) - self.window_size)
+        max_start = max(0, len(self.ids) - self.window_size)
         if self.window_start < max_start:
             self.window_start = min(max_start, self.window_start + self.window_size)
             return True
@@ -185,8 +234,13 @@ def count_effective_chars(text: str) -> int:
         "Hello [citation] world" -> 12 (not 22)
         "The [ref1] quick [ref2] fox" -> 14
     """
-    # Remove all [content] patterns (non-greedy)
-    clean = re.sub(r'\[.*?\]', '', text)
+    # Most notes have no annotations; a memchr-level scan beats entering
+    # the regex engine for the common case
+    if '[' not in text:
+        return len(text.strip())
+
+    # Remove all [content] patterns
+    clean = _BRACKET_RE.sub('', text)
     return len(clean.strip())
 
 
@@ -211,94 +265,370 @@ def get_char_status(text: str) -> tuple[int, int, str]:
     return (effective, total, status)
 
 
+class DashboardCache:
+    """
+    Process-wide cache of pre-rendered dashboard values.
+
+    Entries are keyed by name and validated against a cheap data-version
+    stamp, so reopening the dashboard skips SQL entirely while the
+    underlying tables are unchanged. Writers bust the cache explicitly
+    after a successful commit.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[tuple, object]] = {}
+
+    def stamp(self, conn: sqlite3.Connection) -> tuple:
+        """Get the current data-version stamp (changes when either table does)."""
+        return tuple(conn.execute("""
+            SELECT MAX(rowid), COUNT(*) FROM zettelkasten
+            UNION ALL
+            SELECT MAX(rowid), COUNT(*) FROM zettel_links
+        """).fetchall())
+
+    def get(self, name: str, stamp: tuple):
+        """Return the cached value for name, or None if stale or missing."""
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        return None
+
+    def put(self, name: str, stamp: tuple, value) -> None:
+        """Store a value under name for the given stamp."""
+        self._entries[name] = (stamp, value)
+
+    def clear(self) -> None:
+        """Drop all cached values (called after writes)."""
+        self._entries.clear()
+
+
+# Shared across screens so any writer can invalidate the dashboard
+dashboard_cache = DashboardCache()
+
+
 class ZettelDB:
     """Database helper for Zettelkasten operations."""
 
+    # Statement text must stay byte-identical across calls so sqlite3's
+    # per-connection statement cache can reuse the prepared plan
+    _SEARCH_SQL = """
+        SELECT
+            z.zettel_id,
+            z.note,
+            z.created_at,
+            z.conn_count as connection_count
+        FROM zettelkasten z
+        WHERE z.note LIKE ?
+        ORDER BY z.zettel_id
+        LIMIT ?
+    """
+    _SEARCH_FTS_SQL = """
+        SELECT
+            z.zettel_id,
+            z.note,
+            z.created_at,
+            z.conn_count as connection_count
+        FROM zettel_fts f
+        JOIN zettelkasten z ON z.rowid = f.rowid
+        WHERE zettel_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    """
+
     def __init__(self, db_path: Path = None):
         self.db_path = db_path or DB_PATH
+        self._conn: sqlite3.Connection = None
+        self._has_fts: bool = False
+        self._stats_cache: Optional[dict] = None
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared database connection (created lazily).
 
-    def get_card(self, zettel_id: str) -> Optional[dict]:
-        """Get a single card by ID."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        One long-lived connection serves every method: opening a fresh one
+        per call dominated latency for short queries and defeated SQLite's
+        per-connection statement cache. check_same_thread is off because
+        screen workers call in from varying threads.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path), check_same_thread=False, cached_statements=256
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._ensure_counters(conn)
+            self._ensure_indexes(conn)
+            self._ensure_fts(conn)
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _ensure_counters(conn: sqlite3.Connection) -> None:
+        """Add and backfill the counter columns on older databases.
+
+        Every read path selects char_count/conn_count, so a database
+        created before those columns existed is upgraded in place:
+        ALTER TABLE, one backfill UPDATE, and the maintenance triggers.
+        New databases get all of this from schema.sql and only pay the
+        cheap PRAGMA check here.
+        """
+        cols = {row[1] for row in conn.execute("PRAGMA table_info(zettelkasten)")}
+        if 'char_count' not in cols:
+            conn.execute("ALTER TABLE zettelkasten ADD COLUMN char_count INTEGER")
+        if 'conn_count' not in cols:
+            conn.execute(
+                "ALTER TABLE zettelkasten ADD COLUMN conn_count INTEGER NOT NULL DEFAULT 0"
+            )
+        if 'char_count' not in cols or 'conn_count' not in cols:
+            conn.execute("""
+                UPDATE zettelkasten SET
+                    char_count = LENGTH(note),
+                    conn_count = (SELECT COUNT(*) FROM zettel_links
+                                  WHERE from_zettel_id = zettelkasten.zettel_id
+                                     OR to_zettel_id = zettelkasten.zettel_id)
+            """)
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS zettel_char_count_ins AFTER INSERT ON zettelkasten
+            BEGIN
+                UPDATE zettelkasten SET char_count = LENGTH(NEW.note)
+                WHERE zettel_id = NEW.zettel_id;
+            END;
+            CREATE TRIGGER IF NOT EXISTS zettel_char_count_upd AFTER UPDATE OF note ON zettelkasten
+            BEGIN
+                UPDATE zettelkasten SET char_count = LENGTH(NEW.note)
+                WHERE zettel_id = NEW.zettel_id;
+            END;
+            CREATE TRIGGER IF NOT EXISTS links_ins AFTER INSERT ON zettel_links
+            BEGIN
+                UPDATE zettelkasten SET conn_count = conn_count + 1
+                WHERE zettel_id IN (NEW.from_zettel_id, NEW.to_zettel_id);
+            END;
+            CREATE TRIGGER IF NOT EXISTS links_del AFTER DELETE ON zettel_links
+            BEGIN
+                UPDATE zettelkasten SET conn_count = conn_count - 1
+                WHERE zettel_id IN (OLD.from_zettel_id, OLD.to_zettel_id);
+            END;
+        """)
 
-        cursor.execute("""
-            SELECT
-                zettel_id,
-                note,
-                created_at,
-                modified_at
-            FROM zettelkasten
-            WHERE zettel_id = ?
-        """, (zettel_id,))
+    @staticmethod
+    def _ensure_indexes(conn: sqlite3.Connection) -> None:
+        """Create query-critical indexes missing from older databases.
+
+        The links PK (from, to) already covers outbound probes and
+        link_exists; these cover inbound traversal, the orphan/hub
+        listings over the counter columns, and insight lookups.
+        """
+        try:
+            conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_zl_to
+                    ON zettel_links(to_zettel_id, from_zettel_id);
+                CREATE INDEX IF NOT EXISTS idx_orphans
+                    ON zettelkasten(created_at DESC) WHERE conn_count = 0;
+                CREATE INDEX IF NOT EXISTS idx_hubs
+                    ON zettelkasten(conn_count DESC);
+                CREATE INDEX IF NOT EXISTS idx_zii_index
+                    ON zettel_insight_index(index_id);
+            """)
+        except sqlite3.OperationalError:
+            pass  # insight tables are optional
+
+    def _ensure_fts(self, conn: sqlite3.Connection) -> None:
+        """Create and backfill the search FTS table on older databases.
+
+        New databases get the table and sync triggers from schema.sql; the
+        backfill only runs when the table is first created here. Sets
+        _has_fts; search falls back to LIKE when FTS5 is unavailable.
+        """
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'zettel_fts'"
+            ).fetchone()
+            if not exists:
+                conn.executescript("""
+                    CREATE VIRTUAL TABLE zettel_fts USING fts5(
+                        zettel_id UNINDEXED,
+                        note,
+                        content='zettelkasten',
+                        content_rowid='rowid',
+                        tokenize='unicode61 remove_diacritics 2'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS zettel_fts_ins AFTER INSERT ON zettelkasten
+                    BEGIN
+                        INSERT INTO zettel_fts(rowid, zettel_id, note)
+                        VALUES (NEW.rowid, NEW.zettel_id, NEW.note);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS zettel_fts_del AFTER DELETE ON zettelkasten
+                    BEGIN
+                        INSERT INTO zettel_fts(zettel_fts, rowid, zettel_id, note)
+                        VALUES ('delete', OLD.rowid, OLD.zettel_id, OLD.note);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS zettel_fts_upd AFTER UPDATE OF note ON zettelkasten
+                    BEGIN
+                        INSERT INTO zettel_fts(zettel_fts, rowid, zettel_id, note)
+                        VALUES ('delete', OLD.rowid, OLD.zettel_id, OLD.note);
+                        INSERT INTO zettel_fts(rowid, zettel_id, note)
+                        VALUES (NEW.rowid, NEW.zettel_id, NEW.note);
+                    END;
+                    INSERT INTO zettel_fts(rowid, zettel_id, note)
+                    SELECT rowid, zettel_id, note FROM zettelkasten;
+                """)
+            self._has_fts = True
+        except sqlite3.OperationalError:
+            self._has_fts = False
+
+    def close(self) -> None:
+        """Close the shared connection (app shutdown)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # Hot single-row statements as class constants: byte-identical SQL on
+    # every call keeps them pinned in the connection's statement cache
+    _SQL_GET_CARD = """
+        SELECT zettel_id, note, created_at, modified_at
+        FROM zettelkasten WHERE zettel_id = ?
+    """
+    _SQL_CARD_EXISTS = "SELECT 1 FROM zettelkasten WHERE zettel_id = ?"
+    _SQL_LINK_EXISTS = (
+        "SELECT 1 FROM zettel_links WHERE from_zettel_id = ? AND to_zettel_id = ?"
+    )
 
-        row = cursor.fetchone()
-        conn.close()
+    def get_card(self, zettel_id: str) -> Optional[dict]:
+        """Get a single card by ID."""
+        row = self.get_connection().execute(self._SQL_GET_CARD, (zettel_id,)).fetchone()
 
         if row:
             return dict(row)
         return None
 
+    # One round-trip for the card-load hot path: card row, both link
+    # directions, and insights come back as tagged rows split in Python.
+    # The trailing ORDER BY keeps links sorted by id within each kind.
+    _CARD_LINKS_SQL = """
+        SELECT 'card' AS kind, zettel_id AS a, note AS b,
+               created_at AS c, modified_at AS d
+        FROM zettelkasten WHERE zettel_id = ?
+        UNION ALL
+        SELECT 'out', z.zettel_id, z.note, NULL, NULL
+        FROM zettel_links zl
+        JOIN zettelkasten z ON zl.to_zettel_id = z.zettel_id
+        WHERE zl.from_zettel_id = ?
+        UNION ALL
+        SELECT 'in', z.zettel_id, z.note, NULL, NULL
+        FROM zettel_links zl
+        JOIN zettelkasten z ON zl.from_zettel_id = z.zettel_id
+        WHERE zl.to_zettel_id = ?
+    """
+    _INSIGHT_ARM = """
+        UNION ALL
+        SELECT 'insight', ii.index_name, NULL, NULL, NULL
+        FROM zettel_insight_index zii
+        JOIN insight_index ii ON zii.index_id = ii.id
+        WHERE zii.zettel_id = ?
+    """
+    _CARD_LINKS_ORDER = " ORDER BY kind, a"
+
     def get_card_with_links(self, zettel_id: str) -> Optional[dict]:
         """Get a card with its outbound and inbound links."""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = None  # tagged tuples, bucketed below
+
+        try:
+            cursor.execute(
+                self._CARD_LINKS_SQL + self._INSIGHT_ARM + self._CARD_LINKS_ORDER,
+                (zettel_id,) * 4,
+            )
+        except sqlite3.OperationalError:
+            # Insight tables are optional; retry without that arm
+            cursor.execute(
+                self._CARD_LINKS_SQL + self._CARD_LINKS_ORDER,
+                (zettel_id,) * 3,
+            )
+
+        card = None
+        outbound: list[dict] = []
+        inbound: list[dict] = []
+        insights: list[str] = []
+
+        for kind, a, b, c, d in cursor.fetchall():
+            if kind == 'out':
+                outbound.append({'zettel_id': a, 'note': b})
+            elif kind == 'in':
+                inbound.append({'zettel_id': a, 'note': b})
+            elif kind == 'insight':
+                insights.append(a)
+            else:
+                card = {'zettel_id': a, 'note': b, 'created_at': c, 'modified_at': d}
 
-        # Get the card
-        card = self.get_card(zettel_id)
         if not card:
-            conn.close()
             return None
 
-        # Get outbound links
-        cursor.execute("""
-            SELECT z.zettel_id, z.note
-            FROM zettel_links zl
-            JOIN zettelkasten z ON zl.to_zettel_id = z.zettel_id
-            WHERE zl.from_zettel_id = ?
-            ORDER BY z.zettel_id
-        """, (zettel_id,))
-        card['outbound'] = [dict(r) for r in cursor.fetchall()]
-
-        # Get inbound links
-        cursor.execute("""
-            SELECT z.zettel_id, z.note
-            FROM zettel_links zl
-            JOIN zettelkasten z ON zl.from_zettel_id = z.zettel_id
-            WHERE zl.to_zettel_id = ?
-            ORDER BY z.zettel_id
-        """, (zettel_id,))
-        card['inbound'] = [dict(r) for r in cursor.fetchall()]
-
-        # Get insights (optional - may not exist in all schemas)
+        card['outbound'] = outbound
+        card['inbound'] = inbound
+        card['insights'] = insights
+        card['connection_count'] = len(outbound) + len(inbound)
+        return card
+
+    # Card-load summary for CardPanel: no outbound/inbound list
+    # materialization, insights folded into one group_concat column
+    _SQL_CARD_SUMMARY = """
+        SELECT
+            z.zettel_id,
+            z.note,
+            z.created_at,
+            z.conn_count as connection_count,
+            (SELECT group_concat(ii.index_name, CHAR(10))
+             FROM zettel_insight_index zii
+             JOIN insight_index ii ON zii.index_id = ii.id
+             WHERE zii.zettel_id = z.zettel_id) as insight_names
+        FROM zettelkasten z
+        WHERE z.zettel_id = ?
+    """
+    _SQL_CARD_SUMMARY_NO_INSIGHTS = """
+        SELECT
+            z.zettel_id,
+            z.note,
+            z.created_at,
+            z.conn_count as connection_count,
+            NULL as insight_names
+        FROM zettelkasten z
+        WHERE z.zettel_id = ?
+    """
+
+    def get_card_summary(self, zettel_id: str) -> Optional[dict]:
+        """Get just what the card display needs: card, count, insight names.
+
+        Unlike get_card_with_links this never materializes the outbound
+        and inbound row lists, which the card panel does not use.
+        """
+        conn = self.get_connection()
         try:
-            cursor.execute("""
-                SELECT ii.index_name
-                FROM zettel_insight_index zii
-                JOIN insight_index ii ON zii.index_id = ii.id
-                WHERE zii.zettel_id = ?
-            """, (zettel_id,))
-            card['insights'] = [r['index_name'] for r in cursor.fetchall()]
+            row = conn.execute(self._SQL_CARD_SUMMARY, (zettel_id,)).fetchone()
         except sqlite3.OperationalError:
-            card['insights'] = []
+            # Insight tables are optional
+            row = conn.execute(self._SQL_CARD_SUMMARY_NO_INSIGHTS, (zettel_id,)).fetchone()
 
-        # Get connection count
-        card['connection_count'] = len(card['outbound']) + len(card['inbound'])
+        if row is None:
+            return None
 
-        conn.close()
-        return card
+        return {
+            'zettel_id': row['zettel_id'],
+            'note': row['note'],
+            'created_at': row['created_at'],
+            'connection_count': row['connection_count'],
+            'insights': row['insight_names'].split('\n') if row['insight_names'] else [],
+        }
 
-    def get_paths(self, zettel_id: str, limit: int = 10) -> list[dict]:
+    def get_paths(self, zettel_id: str, limit: int = 10) -> list[sqlite3.Row]:
         """
         Get 2-hop paths from a card.
 
-        Returns list of {hop1_id, hop2_id, hop2_preview} dicts.
+        Returns rows keyed hop1_id, hop2_id, hop1_note, hop2_note.
         """
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -317,99 +647,106 @@ class ZettelDB:
             LIMIT ?
         """, (zettel_id, zettel_id, limit))
 
-        paths = [dict(r) for r in cursor.fetchall()]
-        conn.close()
-        return paths
+        # sqlite3.Row already supports key lookup; skip the dict copies
+        return cursor.fetchall()
 
-    def get_all_cards(self, limit: int = 100, order_by: str = 'created_at DESC') -> list[dict]:
-        """Get all cards with connection counts."""
+    def get_all_cards(
+        self,
+        limit: int = 100,
+        order_by: str = 'created_at DESC',
+        filter_substr: str = None,
+    ) -> list[Card]:
+        """Get all cards with connection counts, optionally filtered by ID substring."""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = None  # raw tuples feed Card directly
+
+        where = "WHERE instr(z.zettel_id, ?) > 0" if filter_substr else ""
+        params = (filter_substr, limit) if filter_substr else (limit,)
 
         cursor.execute(f"""
             SELECT
                 z.zettel_id,
-                z.note,
+                REPLACE(SUBSTR(z.note, 1, 200), CHAR(10), ' ') as preview_raw,
+                LENGTH(z.note) as note_len,
                 z.created_at,
-                (
-                    SELECT COUNT(*) FROM zettel_links WHERE from_zettel_id = z.zettel_id
-                ) + (
-                    SELECT COUNT(*) FROM zettel_links WHERE to_zettel_id = z.zettel_id
-                ) as connection_count
+                z.conn_count as connection_count
             FROM zettelkasten z
+            {where}
             ORDER BY {order_by}
             LIMIT ?
-        """, (limit,))
+        """, params)
 
-        cards = [dict(r) for r in cursor.fetchall()]
-        conn.close()
+        cards = [Card(*row) for row in cursor.fetchall()]
         return cards
 
-    def get_hubs(self, limit: int = 20) -> list[dict]:
+    def get_hubs(self, limit: int = 20, filter_substr: str = None) -> list[Card]:
         """Get most connected cards."""
-        return self.get_all_cards(limit=limit, order_by='connection_count DESC')
+        return self.get_all_cards(
+            limit=limit, order_by='connection_count DESC', filter_substr=filter_substr
+        )
 
-    def get_orphans(self) -> list[dict]:
+    def get_orphans(self, filter_substr: str = None) -> list[Card]:
         """Get cards with no connections."""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = None  # raw tuples feed Card directly
 
-        cursor.execute("""
-            SELECT z.zettel_id, z.note, z.created_at, 0 as connection_count
+        where = "AND instr(z.zettel_id, ?) > 0" if filter_substr else ""
+        params = (filter_substr,) if filter_substr else ()
+
+        cursor.execute(f"""
+            SELECT
+                z.zettel_id,
+                REPLACE(SUBSTR(z.note, 1, 200), CHAR(10), ' ') as preview_raw,
+                LENGTH(z.note) as note_len,
+                z.created_at,
+                0 as connection_count
             FROM zettelkasten z
-            WHERE z.zettel_id NOT IN (
-                SELECT from_zettel_id FROM zettel_links
-                UNION
-                SELECT to_zettel_id FROM zettel_links
-            )
+            WHERE z.conn_count = 0
+            {where}
             ORDER BY z.created_at DESC
-        """)
+        """, params)
 
-        orphans = [dict(r) for r in cursor.fetchall()]
-        conn.close()
+        orphans = [Card(*row) for row in cursor.fetchall()]
         return orphans
 
-    def search_cards(self, query: str, limit: int = 50) -> list[dict]:
+    def search_cards(self, query: str, limit: int = 50) -> list[sqlite3.Row]:
         """Search cards by note content."""
+        return list(self.iter_search_cards(query, limit))
+
+    def iter_search_cards(self, query: str, limit: int = 50) -> Iterator[sqlite3.Row]:
+        """Yield search results as the cursor produces them.
+
+        Lets callers show the first rows before the full result set is in.
+        """
         conn = self.get_connection()
-        cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT
-                z.zettel_id,
-                z.note,
-                z.created_at,
-                (
-                    SELECT COUNT(*) FROM zettel_links WHERE from_zettel_id = z.zettel_id
-                ) + (
-                    SELECT COUNT(*) FROM zettel_links WHERE to_zettel_id = z.zettel_id
-                ) as connection_count
-            FROM zettelkasten z
-            WHERE z.note LIKE ?
-            ORDER BY z.zettel_id
-            LIMIT ?
-        """, (f'%{query}%', limit))
+        # Word-only queries use the inverted index with prefix terms,
+        # ranked by relevance; anything else keeps LIKE's substring
+        # semantics over a full scan
+        if self._has_fts and len(query) >= 3 and _FTS_QUERY_RE.fullmatch(query):
+            match = ' '.join(f'"{token}"*' for token in query.split())
+            cursor = conn.execute(self._SEARCH_FTS_SQL, (match, limit))
+        else:
+            cursor = conn.execute(self._SEARCH_SQL, (f'%{query}%', limit))
 
-        results = [dict(r) for r in cursor.fetchall()]
-        conn.close()
-        return results
+        yield from cursor
 
     def get_stats(self) -> dict:
-        """Get Zettelkasten statistics."""
+        """Get Zettelkasten statistics (cached until the next write)."""
+        if self._stats_cache is not None:
+            return self._stats_cache
+
         conn = self.get_connection()
         cursor = conn.cursor()
 
         total_notes = cursor.execute("SELECT COUNT(*) FROM zettelkasten").fetchone()[0]
         total_links = cursor.execute("SELECT COUNT(*) FROM zettel_links").fetchone()[0]
 
-        orphan_count = cursor.execute("""
-            SELECT COUNT(*) FROM zettelkasten z
-            WHERE z.zettel_id NOT IN (
-                SELECT from_zettel_id FROM zettel_links
-                UNION
-                SELECT to_zettel_id FROM zettel_links
-            )
-        """).fetchone()[0]
+        orphan_count = cursor.execute(
+            "SELECT COUNT(*) FROM zettelkasten WHERE conn_count = 0"
+        ).fetchone()[0]
 
         # Insight count is optional
         try:
@@ -417,19 +754,19 @@ class ZettelDB:
         except sqlite3.OperationalError:
             insight_count = 0
 
-        conn.close()
 
         avg_connections = (total_links * 2) / total_notes if total_notes > 0 else 0
 
-        return {
+        self._stats_cache = {
             'total_notes': total_notes,
             'total_links': total_links,
             'orphan_count': orphan_count,
             'insight_count': insight_count,
             'avg_connections': round(avg_connections, 1),
         }
+        return self._stats_cache
 
-    def get_insight_index(self) -> list[dict]:
+    def get_insight_index(self) -> list[sqlite3.Row]:
         """Get all insights with card counts."""
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -445,14 +782,13 @@ class ZettelDB:
                 GROUP BY ii.id, ii.index_name
                 ORDER BY card_count DESC
             """)
-            insights = [dict(r) for r in cursor.fetchall()]
+            insights = cursor.fetchall()
         except sqlite3.OperationalError:
             insights = []
 
-        conn.close()
         return insights
 
-    def get_all_insights_simple(self) -> list[dict]:
+    def get_all_insights_simple(self) -> list[sqlite3.Row]:
         """Get all insights (id, name) without card counts - for tag picker."""
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -463,14 +799,13 @@ class ZettelDB:
                 FROM insight_index
                 ORDER BY index_name
             """)
-            insights = [dict(r) for r in cursor.fetchall()]
+            insights = cursor.fetchall()
         except sqlite3.OperationalError:
             insights = []
 
-        conn.close()
         return insights
 
-    def search_insights(self, query: str) -> list[dict]:
+    def search_insights(self, query: str) -> list[sqlite3.Row]:
         """Search insights by name (case-insensitive substring match)."""
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -482,19 +817,18 @@ class ZettelDB:
                 WHERE LOWER(index_name) LIKE LOWER(?)
                 ORDER BY index_name
             """, (f'%{query}%',))
-            insights = [dict(r) for r in cursor.fetchall()]
+            insights = cursor.fetchall()
         except sqlite3.OperationalError:
             insights = []
 
-        conn.close()
         return insights
 
     def _slugify(self, name: str) -> str:
         """Convert a name to a slug for insight ID."""
         # Lowercase, replace spaces with hyphens, remove special chars
         slug = name.lower().strip()
-        slug = re.sub(r'\s+', '-', slug)
-        slug = re.sub(r'[^a-z0-9\-]', '', slug)
+        slug = _WS_RE.sub('-', slug)
+        slug = _NONSLUG_RE.sub('', slug)
         return slug
 
     def create_insight(self, name: str) -> Optional[str]:
@@ -516,15 +850,16 @@ class ZettelDB:
                 (insight_id, name.strip())
             )
             conn.commit()
+            self._stats_cache = None
             return insight_id
         except sqlite3.IntegrityError:
+            conn.rollback()  # shared connection: drop the failed INSERT's txn
             return None  # Already exists
         except sqlite3.OperationalError:
+            conn.rollback()
             return None
-        finally:
-            conn.close()
 
-    def get_card_insights(self, zettel_id: str) -> list[dict]:
+    def get_card_insights(self, zettel_id: str) -> list[sqlite3.Row]:
         """Get insights for a specific card."""
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -537,11 +872,10 @@ class ZettelDB:
                 WHERE zii.zettel_id = ?
                 ORDER BY ii.index_name
             """, (zettel_id,))
-            insights = [dict(r) for r in cursor.fetchall()]
+            insights = cursor.fetchall()
         except sqlite3.OperationalError:
             insights = []
 
-        conn.close()
         return insights
 
     def add_insight_to_card(self, zettel_id: str, insight_id: str) -> bool:
@@ -557,11 +891,11 @@ class ZettelDB:
             conn.commit()
             return True
         except sqlite3.IntegrityError:
+            conn.rollback()
             return False  # Already tagged or invalid
         except sqlite3.OperationalError:
+            conn.rollback()
             return False
-        finally:
-            conn.close()
 
     def remove_insight_from_card(self, zettel_id: str, insight_id: str) -> bool:
         """Remove an insight tag from a card."""
@@ -577,46 +911,59 @@ class ZettelDB:
             conn.commit()
             return deleted
         except sqlite3.OperationalError:
+            conn.rollback()
             return False
-        finally:
-            conn.close()
 
-    def get_cards_by_insight(self, insight_id: str) -> list[dict]:
+    def get_cards_by_insight(self, insight_id: str) -> list[Card]:
         """Get all cards tagged with a specific insight."""
         conn = self.get_connection()
         cursor = conn.cursor()
+        cursor.row_factory = None  # raw tuples feed Card directly
 
         try:
             cursor.execute("""
                 SELECT
                     z.zettel_id,
-                    z.note,
+                    REPLACE(SUBSTR(z.note, 1, 200), CHAR(10), ' ') as preview_raw,
+                    LENGTH(z.note) as note_len,
                     z.created_at,
-                    (
-                        SELECT COUNT(*) FROM zettel_links WHERE from_zettel_id = z.zettel_id
-                    ) + (
-                        SELECT COUNT(*) FROM zettel_links WHERE to_zettel_id = z.zettel_id
-                    ) as connection_count
+                    z.conn_count as connection_count
                 FROM zettelkasten z
                 JOIN zettel_insight_index zii ON z.zettel_id = zii.zettel_id
                 WHERE zii.index_id = ?
                 ORDER BY z.created_at DESC
             """, (insight_id,))
-            cards = [dict(r) for r in cursor.fetchall()]
+            cards = [Card(*row) for row in cursor.fetchall()]
         except sqlite3.OperationalError:
             cards = []
 
-        conn.close()
         return cards
 
-    def card_exists(self, zettel_id: str) -> bool:
-        """Check if a card exists."""
+    def existing_cards(self, ids: list[str]) -> set[str]:
+        """Return the subset of the given IDs that exist, in one query."""
+        if not ids:
+            return set()
+
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM zettelkasten WHERE zettel_id = ?", (zettel_id,))
-        exists = cursor.fetchone() is not None
-        conn.close()
-        return exists
+
+        found: set[str] = set()
+        # Chunk to stay under SQLite's default 999-parameter limit
+        for start in range(0, len(ids), 900):
+            chunk = ids[start:start + 900]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f"SELECT zettel_id FROM zettelkasten WHERE zettel_id IN ({placeholders})",
+                chunk
+            )
+            found.update(row[0] for row in cursor.fetchall())
+
+        return found
+
+    def card_exists(self, zettel_id: str) -> bool:
+        """Check if a card exists."""
+        cursor = self.get_connection().execute(self._SQL_CARD_EXISTS, (zettel_id,))
+        return cursor.fetchone() is not None
 
     def create_card(self, zettel_id: str, note: str, link_to: list[str] = None) -> bool:
         """
@@ -637,22 +984,84 @@ class ZettelDB:
                 VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
             """, (zettel_id, note))
 
-            # Create links
+            # Create links: one IN query filters valid targets, one
+            # executemany inserts them, instead of two statements per link
             if link_to:
-                for target_id in link_to:
-                    if self.card_exists(target_id):
-                        cursor.execute("""
-                            INSERT INTO zettel_links (from_zettel_id, to_zettel_id)
-                            VALUES (?, ?)
-                        """, (zettel_id, target_id))
+                placeholders = ','.join('?' * len(link_to))
+                cursor.execute(
+                    f"SELECT zettel_id FROM zettelkasten WHERE zettel_id IN ({placeholders})",
+                    link_to
+                )
+                valid = {row[0] for row in cursor.fetchall()}
+                cursor.executemany(
+                    "INSERT INTO zettel_links (from_zettel_id, to_zettel_id) VALUES (?, ?)",
+                    [(zettel_id, t) for t in link_to if t in valid]
+                )
 
             conn.commit()
+            self._stats_cache = None
             return True
         except Exception:
             conn.rollback()
             return False
-        finally:
-            conn.close()
+
+    def create_card_with_links(
+        self,
+        zettel_id: str,
+        note: str,
+        link_ids: list[str] = None,
+    ) -> CreateResult:
+        """
+        Create a card and its links in a single transaction.
+
+        Existence check, link validation, and all inserts share one
+        BEGIN IMMEDIATE ... COMMIT, so the whole create is one fsync and
+        nothing can change between the checks and the writes.
+        """
+        link_ids = link_ids or []
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            cursor.execute(
+                "SELECT 1 FROM zettelkasten WHERE zettel_id = ?", (zettel_id,)
+            )
+            if cursor.fetchone():
+                conn.rollback()
+                return CreateResult(success=False, exists=True)
+
+            # Validate all link targets with one IN query
+            found: set[str] = set()
+            for start in range(0, len(link_ids), 900):
+                chunk = link_ids[start:start + 900]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"SELECT zettel_id FROM zettelkasten WHERE zettel_id IN ({placeholders})",
+                    chunk
+                )
+                found.update(row[0] for row in cursor.fetchall())
+
+            cursor.execute("""
+                INSERT INTO zettelkasten (zettel_id, note, created_at, modified_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            """, (zettel_id, note))
+
+            cursor.executemany(
+                "INSERT INTO zettel_links (from_zettel_id, to_zettel_id) VALUES (?, ?)",
+                [(zettel_id, target) for target in link_ids if target in found]
+            )
+
+            conn.commit()
+            self._stats_cache = None
+            return CreateResult(
+                success=True,
+                missing_targets=[i for i in link_ids if i not in found],
+            )
+        except Exception:
+            conn.rollback()
+            return CreateResult(success=False)
 
     def add_link(self, from_id: str, to_id: str) -> bool:
         """Add a link between two cards."""
@@ -673,25 +1082,32 @@ class ZettelDB:
                 (from_id, to_id)
             )
             conn.commit()
+            self._stats_cache = None
             return True
         except Exception:
             conn.rollback()
             return False
-        finally:
-            conn.close()
 
-    def link_exists(self, from_id: str, to_id: str) -> bool:
-        """Check if a link already exists between two cards."""
+    def validate_link(self, from_id: str, to_id: str) -> tuple[bool, bool]:
+        """Check target existence and link existence in one round-trip.
+
+        Returns (target_exists, link_exists).
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
-        try:
-            cursor.execute(
-                "SELECT 1 FROM zettel_links WHERE from_zettel_id = ? AND to_zettel_id = ?",
-                (from_id, to_id)
-            )
-            return cursor.fetchone() is not None
-        finally:
-            conn.close()
+        cursor.execute("""
+            SELECT
+                EXISTS(SELECT 1 FROM zettelkasten WHERE zettel_id = ?),
+                EXISTS(SELECT 1 FROM zettel_links
+                       WHERE from_zettel_id = ? AND to_zettel_id = ?)
+        """, (to_id, from_id, to_id))
+        target_exists, link_exists = cursor.fetchone()
+        return (bool(target_exists), bool(link_exists))
+
+    def link_exists(self, from_id: str, to_id: str) -> bool:
+        """Check if a link already exists between two cards."""
+        cursor = self.get_connection().execute(self._SQL_LINK_EXISTS, (from_id, to_id))
+        return cursor.fetchone() is not None
 
     def append_link_annotation(self, from_id: str, to_id: str, reason: str) -> bool:
         """
@@ -702,52 +1118,40 @@ class ZettelDB:
 
         Returns True if successful.
         """
-        if from_id == to_id:
-            return False  # Can't link to self
-
         if not reason or not reason.strip():
             return False  # Reason is required
 
-        if not self.card_exists(from_id):
-            return False  # Source must exist
-
-        if not self.card_exists(to_id):
-            return False  # Target must exist
-
         conn = self.get_connection()
         cursor = conn.cursor()
 
         try:
-            # Check if link already exists
+            # One transaction, no pre-check SELECTs: the FK constraints
+            # reject missing cards, the CHECK rejects self-links, and OR
+            # IGNORE plus rowcount detects an existing link
+            cursor.execute("BEGIN IMMEDIATE")
+
             cursor.execute(
-                "SELECT 1 FROM zettel_links WHERE from_zettel_id = ? AND to_zettel_id = ?",
+                "INSERT OR IGNORE INTO zettel_links (from_zettel_id, to_zettel_id) VALUES (?, ?)",
                 (from_id, to_id)
             )
-            if cursor.fetchone():
+            if cursor.rowcount == 0:
+                conn.rollback()
                 return False  # Link already exists
 
-            # Build annotation
+            # Append annotation to the source note
             annotation = f"\n\n→{to_id}: {reason}"
-
-            # Append to note (single transaction)
             cursor.execute(
                 "UPDATE zettelkasten SET note = note || ?, modified_at = CURRENT_TIMESTAMP WHERE zettel_id = ?",
                 (annotation, from_id)
             )
 
-            # Create link
-            cursor.execute(
-                "INSERT INTO zettel_links (from_zettel_id, to_zettel_id) VALUES (?, ?)",
-                (from_id, to_id)
-            )
-
             conn.commit()
+            self._stats_cache = None
             return True
         except Exception:
+            # IntegrityError covers missing cards and self-links
             conn.rollback()
             return False
-        finally:
-            conn.close()
 
     def delete_link(self, from_id: str, to_id: str) -> bool:
         """Delete a link between two cards. For testing/cleanup."""
@@ -760,12 +1164,11 @@ class ZettelDB:
             )
             deleted = cursor.rowcount > 0
             conn.commit()
+            self._stats_cache = None
             return deleted
         except Exception:
             conn.rollback()
             return False
-        finally:
-            conn.close()
 
     def delete_card(self, zettel_id: str) -> bool:
         """Delete a card and its links (CASCADE). For testing/cleanup."""
@@ -775,27 +1178,61 @@ class ZettelDB:
             cursor.execute("DELETE FROM zettelkasten WHERE zettel_id = ?", (zettel_id,))
             deleted = cursor.rowcount > 0
             conn.commit()
+            self._stats_cache = None
             return deleted
         except Exception:
             conn.rollback()
             return False
-        finally:
-            conn.close()
+
+    def bulk_delete(self, ids: list[str]) -> int:
+        """Delete many cards in one transaction. Returns count deleted.
+
+        Cleanup paths that delete cards one by one pay a commit (and its
+        fsync) per card; this batches chunked IN deletes under a single
+        commit, staying below SQLite's 999-parameter limit.
+        """
+        if not ids:
+            return 0
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            deleted = 0
+            for start in range(0, len(ids), 900):
+                chunk = ids[start:start + 900]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"DELETE FROM zettelkasten WHERE zettel_id IN ({placeholders})",
+                    chunk
+                )
+                deleted += cursor.rowcount
+            conn.commit()
+            self._stats_cache = None
+            return deleted
+        except Exception:
+            conn.rollback()
+            return 0
 
     def delete_cards_by_prefix(self, prefix: str) -> int:
         """Delete all cards starting with prefix. Returns count deleted."""
+        if not prefix:
+            return 0
+
         conn = self.get_connection()
         cursor = conn.cursor()
         try:
+            # Half-open range on the id B-tree instead of LIKE: no pattern
+            # match per row, and the PK index bounds the scan directly
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
             cursor.execute(
-                "DELETE FROM zettelkasten WHERE zettel_id LIKE ?",
-                (prefix + '%',)
+                "DELETE FROM zettelkasten WHERE zettel_id >= ? AND zettel_id < ?",
+                (prefix, upper)
             )
             count = cursor.rowcount
             conn.commit()
+            self._stats_cache = None
             return count
         except Exception:
             conn.rollback()
             return 0
-        finally:
-            conn.close()
@@ -30,6 +30,9 @@ class CardPanel(Widget):
     def __init__(self, db: ZettelDB = None, **kwargs):
         super().__init__(**kwargs)
         self.db = db or ZettelDB()
+        # Rendered tag markup, reused while the insight list is unchanged
+        self._insight_key: tuple = None
+        self._insight_cache: str = ""
 
     def compose(self) -> ComposeResult:
         """Compose the card panel."""
@@ -48,7 +51,8 @@ class CardPanel(Widget):
 
         Returns True if card was found and loaded.
         """
-        card = self.db.get_card_with_links(zettel_id)
+        # Summary query: the full link lists are only needed by LinksPanel
+        card = self.db.get_card_summary(zettel_id)
         if not card:
             return False
 
@@ -57,7 +61,7 @@ class CardPanel(Widget):
         self.created_at = card['created_at'][:10] if card['created_at'] else 'unknown'
         self.char_count = count_effective_chars(card['note'])
         self.connection_count = card['connection_count']
-        self.insights = card.get('insights', [])
+        self.insights = card['insights']
 
         self._update_display()
         return True
@@ -78,13 +82,13 @@ class CardPanel(Widget):
         text_widget = self.query_one("#card-text", Static)
         text_widget.update(self.note_content)
 
-        # Update insights
+        # Update insights (markup rebuilt only when the tag list changes)
         insights_widget = self.query_one("#card-insights", Static)
-        if self.insights:
-            tags = "  ".join([f"[purple]#{tag}[/]" for tag in self.insights])
-            insights_widget.update(tags)
-        else:
-            insights_widget.update("")
+        key = tuple(self.insights)
+        if key != self._insight_key:
+            self._insight_key = key
+            self._insight_cache = "  ".join(f"[purple]#{tag}[/]" for tag in key)
+        insights_widget.update(self._insight_cache)
 
     def clear(self) -> None:
         """Clear the card display."""
@@ -1,5 +1,8 @@
 """Links Panel - Outbound and inbound links with hotkey navigation."""
 
+from functools import lru_cache
+from itertools import islice
+
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import Static
@@ -10,6 +13,36 @@ from textual.message import Message
 from zettel.utils import ZettelDB
 
 
+# Placeholder markup shared across updates: one string object each, so the
+# unchanged-content check in _set_markup is a pointer comparison
+_NO_OUTBOUND = "[dim]  (no outbound links)[/]"
+_NO_INBOUND = "[dim]  (no inbound links)[/]"
+_NO_CARD = "[dim]  (no card selected)[/]"
+
+
+@lru_cache(maxsize=4096)
+def _render_link(num: int, zettel_id: str, preview: str) -> str:
+    """Render one numbered link as its two-line markup block.
+
+    Process-global so every panel instance rendering the same link in the
+    same slot shares one string object, however many views are open.
+    """
+    return f"[cyan bold][{num}][/] [#d4a574]{zettel_id:12}[/]\n    [dim]{preview}[/]"
+
+
+@lru_cache(maxsize=256)
+def _render_link_block(start: int, items: tuple[tuple[str, str], ...]) -> str:
+    """Render a numbered link list from ((zettel_id, preview), ...) pairs.
+
+    Pure function of its arguments, so repeated displays of the same card
+    (re-focus, resize) reuse the cached markup instead of reformatting.
+    """
+    return "\n".join(
+        _render_link(i, zettel_id, preview)
+        for i, (zettel_id, preview) in enumerate(items, start)
+    )
+
+
 class LinksPanel(Widget):
     """
     Links panel showing outbound and inbound connections.
@@ -22,6 +55,11 @@ class LinksPanel(Widget):
 
     class LinkJump(Message):
         """Message sent when user jumps to a linked card."""
+
+        # Message itself is slotted; declaring the payload keeps these
+        # per-keystroke instances free of a __dict__
+        __slots__ = ('zettel_id',)
+
         def __init__(self, zettel_id: str) -> None:
             self.zettel_id = zettel_id
             super().__init__()
@@ -34,6 +72,14 @@ class LinksPanel(Widget):
     def __init__(self, db: ZettelDB = None, **kwargs):
         super().__init__(**kwargs)
         self.db = db or ZettelDB()
+        # (zettel_id, preview) pairs for the visible slots, truncated once
+        # when the rows arrive rather than on every redraw
+        self._out_items: tuple[tuple[str, str], ...] = ()
+        self._in_items: tuple[tuple[str, str], ...] = ()
+        # Last markup pushed to each list widget, to skip no-op updates
+        self._last_markup: dict[str, str] = {}
+        # Child Statics resolved once; query_one walks the DOM per call
+        self._widgets: dict[str, Static] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the links panel."""
@@ -48,50 +94,72 @@ class LinksPanel(Widget):
 
     def load_links(self, zettel_id: str) -> None:
         """Load links for a card."""
-        self.zettel_id = zettel_id
-
         card = self.db.get_card_with_links(zettel_id)
-        if card:
-            self.outbound = card.get('outbound', [])
-            self.inbound = card.get('inbound', [])
-        else:
-            self.outbound = []
-            self.inbound = []
 
-        self._update_display()
+        # Each reactive assignment schedules its own refresh; batch them
+        # with the display update so the panel repaints once
+        with self.app.batch_update():
+            self.zettel_id = zettel_id
+            if card:
+                self.outbound = card.get('outbound', [])
+                self.inbound = card.get('inbound', [])
+            else:
+                self.outbound = []
+                self.inbound = []
+            # islice keeps the visible-slot cap without copying the lists
+            self._out_items = tuple(
+                (link['zettel_id'], self._truncate(link['note'], 35))
+                for link in islice(self.outbound, 3)
+            )
+            self._in_items = tuple(
+                (link['zettel_id'], self._truncate(link['note'], 35))
+                for link in islice(self.inbound, 3)
+            )
+            self._update_display()
 
     def _update_display(self) -> None:
         """Update the display widgets."""
-        # Update outbound list
-        outbound_widget = self.query_one("#outbound-list", Static)
-        if self.outbound:
-            lines = []
-            for i, link in enumerate(self.outbound[:3], 1):
-                preview = self._truncate(link['note'], 35)
-                lines.append(f"[cyan bold][{i}][/] [#d4a574]{link['zettel_id']:12}[/]")
-                lines.append(f"    [dim]{preview}[/]")
-            outbound_widget.update("\n".join(lines))
+        if self._out_items:
+            out_markup = _render_link_block(1, self._out_items)
         else:
-            outbound_widget.update("[dim]  (no outbound links)[/]")
-
-        # Update inbound list
-        inbound_widget = self.query_one("#inbound-list", Static)
-        if self.inbound:
-            lines = []
-            for i, link in enumerate(self.inbound[:3], 4):
-                preview = self._truncate(link['note'], 35)
-                lines.append(f"[cyan bold][{i}][/] [#d4a574]{link['zettel_id']:12}[/]")
-                lines.append(f"    [dim]{preview}[/]")
-            inbound_widget.update("\n".join(lines))
+            out_markup = _NO_OUTBOUND
+        self._set_markup("#outbound-list", out_markup)
+
+        if self._in_items:
+            in_markup = _render_link_block(4, self._in_items)
         else:
-            inbound_widget.update("[dim]  (no inbound links)[/]")
+            in_markup = _NO_INBOUND
+        self._set_markup("#inbound-list", in_markup)
+
+    def _set_markup(self, selector: str, markup: str) -> None:
+        """Push markup to a widget, skipping the update when unchanged.
+
+        A no-op Static.update still costs a layout pass, so identical
+        content (refocus, redundant refresh) short-circuits here.
+        """
+        if self._last_markup.get(selector) != markup:
+            self._last_markup[selector] = markup
+            widget = self._widgets.get(selector)
+            if widget is None:
+                widget = self._widgets[selector] = self.query_one(selector, Static)
+            widget.update(markup)
 
     def _truncate(self, text: str, max_len: int) -> str:
         """Truncate text and clean newlines."""
-        clean = text.replace('\n', ' ')
-        if len(clean) > max_len:
-            return clean[:max_len] + "..."
-        return clean
+        suffix = "..." if len(text) > max_len else ""
+        text = text[:max_len]
+        # replace is 1:1 so only the kept slice needs cleaning, and only
+        # when a newline is actually present (most notes are single-line)
+        if '\n' in text:
+            text = text.replace('\n', ' ')
+        return text + suffix
+
+    # Digit key → (link list attribute, slot index), built once instead of
+    # re-deriving it from range checks on every keystroke
+    _KEY_SLOTS = {
+        **{str(n): ('outbound', n - 1) for n in (1, 2, 3)},
+        **{str(n): ('inbound', n - 4) for n in (4, 5, 6)},
+    }
 
     def handle_key(self, key: str) -> bool:
         """
@@ -102,37 +170,56 @@ class LinksPanel(Widget):
 
         Returns True if the key was handled.
         """
-        if not key.isdigit():
+        slot = self._KEY_SLOTS.get(key)
+        if slot is None:
             return False
 
-        num = int(key)
+        links = getattr(self, slot[0])
+        if slot[1] < len(links):
+            self.post_message(self.LinkJump(links[slot[1]]['zettel_id']))
+            return True
+        return False
 
-        # Outbound links: 1, 2, 3
-        if 1 <= num <= 3:
-            idx = num - 1
-            if idx < len(self.outbound):
-                self.post_message(self.LinkJump(self.outbound[idx]['zettel_id']))
-                return True
+    def handle_keys(self, keys: str) -> bool:
+        """
+        Follow a sequence of link keys and jump once to the destination.
 
-        # Inbound links: 4, 5, 6
-        elif 4 <= num <= 6:
-            idx = num - 4
-            if idx < len(self.inbound):
-                self.post_message(self.LinkJump(self.inbound[idx]['zettel_id']))
-                return True
+        Each key selects a slot from the links of the card reached so
+        far, resolving intermediate hops straight from the database.
+        Only the final destination posts a LinkJump, so programmatic
+        traversal (macros, scripted walks) costs one checkout and one
+        redraw instead of one per hop.
 
-        return False
+        Returns True if the whole sequence resolved.
+        """
+        if not keys:
+            return False
+
+        outbound, inbound = self.outbound, self.inbound
+        last = len(keys) - 1
+        for i, key in enumerate(keys):
+            slot = self._KEY_SLOTS.get(key)
+            if slot is None:
+                return False
+            links = outbound if slot[0] == 'outbound' else inbound
+            if slot[1] >= len(links):
+                return False
+            target = links[slot[1]]['zettel_id']
+            if i < last:
+                card = self.db.get_card_with_links(target)
+                outbound = card.get('outbound', []) if card else []
+                inbound = card.get('inbound', []) if card else []
+
+        self.post_message(self.LinkJump(target))
+        return True
 
     def get_link_by_number(self, num: int) -> str | None:
         """Get the zettel_id for a numbered link."""
-        if 1 <= num <= 3:
-            idx = num - 1
-            if idx < len(self.outbound):
-                return self.outbound[idx]['zettel_id']
-        elif 4 <= num <= 6:
-            idx = num - 4
-            if idx < len(self.inbound):
-                return self.inbound[idx]['zettel_id']
+        slot = self._KEY_SLOTS.get(str(num))
+        if slot is not None:
+            links = getattr(self, slot[0])
+            if slot[1] < len(links):
+                return links[slot[1]]['zettel_id']
         return None
 
     def clear(self) -> None:
@@ -140,5 +227,7 @@ class LinksPanel(Widget):
         self.zettel_id = ""
         self.outbound = []
         self.inbound = []
-        self.query_one("#outbound-list", Static).update("[dim]  (no card selected)[/]")
-        self.query_one("#inbound-list", Static).update("[dim]  (no card selected)[/]")
+        self._out_items = ()
+        self._in_items = ()
+        self._set_markup("#outbound-list", _NO_CARD)
+        self._set_markup("#inbound-list", _NO_CARD)
@@ -1,5 +1,7 @@
 """Trail Panel - Session history sidebar with navigation."""
 
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.widget import Widget
 from textual.widgets import Static
@@ -11,6 +13,27 @@ from textual.binding import Binding
 from zettel.utils import SessionTrail
 
 
+# Placeholder markup shared across updates (see _set_markup)
+_TRAIL_EMPTY = "  (empty)"
+_TRAIL_NAV = "[dim][<] older  [>] newer[/]"
+
+
+@lru_cache(maxsize=256)
+def _format_trail_line(actual_pos: int, zettel_id: str, is_current: bool,
+                       is_cursor: bool) -> str:
+    """Render one trail entry as a single markup line.
+
+    Between refreshes only a line or two actually changes (cursor move,
+    new checkout); the content-keyed cache lets the rest reuse their
+    previously rendered markup.
+    """
+    marker = " [bold gold1]←[/]" if is_current else ""
+    if is_cursor:
+        return f"[reverse][cyan]{actual_pos:>3}[/] {zettel_id}{marker}[/reverse]"
+    style = "bold gold1" if is_current else "white"
+    return f"[cyan]{actual_pos:>3}[/] [{style}]{zettel_id}[/]{marker}"
+
+
 class TrailPanel(Widget):
     """
     Session trail panel showing checkout history.
@@ -36,16 +59,26 @@ class TrailPanel(Widget):
 
     class TrailJump(Message):
         """Message sent when user jumps to a trail entry."""
+
+        # Slotted payload, matching LinksPanel.LinkJump
+        __slots__ = ('zettel_id',)
+
         def __init__(self, zettel_id: str) -> None:
             self.zettel_id = zettel_id
             super().__init__()
 
     class TrailSelected(Message):
         """Message sent when user selects a trail entry via Enter."""
+
+        __slots__ = ('zettel_id',)
+
         def __init__(self, zettel_id: str) -> None:
             self.zettel_id = zettel_id
             super().__init__()
 
+    # Seconds to let a resize burst settle before recomputing the window
+    RESIZE_DEBOUNCE = 0.05
+
     # Reactive trail data - when this changes, we re-render
     trail_data: reactive[list[tuple[int, str, bool]]] = reactive([])
     total_count: reactive[int] = reactive(0)
@@ -56,6 +89,13 @@ class TrailPanel(Widget):
     def __init__(self, trail: SessionTrail, **kwargs):
         super().__init__(**kwargs)
         self.trail = trail
+        self._resize_timer = None
+        # Last markup pushed to each widget, to skip no-op updates
+        self._last_markup: dict[str, str] = {}
+        # Child Statics resolved once; query_one walks the DOM per call
+        self._widgets: dict[str, Static] = {}
+        # Full display state behind the last render, for whole-pass skips
+        self._last_state_key: tuple = None
 
     def compose(self) -> ComposeResult:
         """Compose the trail panel."""
@@ -72,7 +112,16 @@ class TrailPanel(Widget):
         self.refresh_trail()
 
     def on_resize(self, event) -> None:
-        """Handle resize to update window size."""
+        """Handle resize to update window size (debounced)."""
+        # Dragging the terminal fires a burst of resize events; only the
+        # last one in the burst recomputes the window and re-renders
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(self.RESIZE_DEBOUNCE, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        """Recompute the window once a resize burst has settled."""
+        self._resize_timer = None
         self._update_window_size()
         self.refresh_trail()
 
@@ -88,54 +137,73 @@ class TrailPanel(Widget):
 
     def refresh_trail(self) -> None:
         """Refresh the trail display from current state."""
-        self.trail_data = self.trail.get_visible_entries()
-        self.total_count = self.trail.total
-        before, after = self.trail.get_overflow_info()
-        self.overflow_before = before
-        self.overflow_after = after
-        self._update_display()
+        entries, total, before, after = self.trail.get_snapshot()
+
+        # Four reactive assignments each schedule a refresh; batch them
+        # with the display update so the panel repaints once
+        with self.app.batch_update():
+            self.trail_data = entries
+            self.total_count = total
+            self.overflow_before = before
+            self.overflow_after = after
+            self._update_display()
 
     def _update_display(self) -> None:
         """Update the display widgets."""
+        # refresh_trail fires from checkout, resize and back/forward, many
+        # of which change nothing visible; identical state skips the whole
+        # pass before any markup is built
+        state_key = (
+            tuple(self.trail_data),
+            self.total_count,
+            self.overflow_before,
+            self.overflow_after,
+            self.cursor_index,
+            self.has_focus,
+        )
+        if state_key == self._last_state_key:
+            return
+        self._last_state_key = state_key
+
         # Update count
-        count_widget = self.query_one("#trail-count", Static)
-        if self.total_count > 0:
-            count_widget.update(f"({self.total_count} total)")
-        else:
-            count_widget.update("")
+        count = f"({self.total_count} total)" if self.total_count > 0 else ""
+        self._set_markup("#trail-count", count)
 
         # Update overflow indicator
-        overflow_widget = self.query_one("#trail-overflow", Static)
-        if self.overflow_before > 0:
-            overflow_widget.update(f"  ↑ {self.overflow_before} more")
-        else:
-            overflow_widget.update("")
+        overflow = f"  ↑ {self.overflow_before} more" if self.overflow_before > 0 else ""
+        self._set_markup("#trail-overflow", overflow)
 
         # Update trail list
-        list_widget = self.query_one("#trail-list", Static)
         if not self.trail_data:
-            list_widget.update("  (empty)")
+            listing = _TRAIL_EMPTY
         else:
-            lines = []
-            is_focused = self.has_focus
-            for i, (actual_pos, zettel_id, is_current) in enumerate(self.trail_data):
-                marker = " [bold gold1]←[/]" if is_current else ""
-                # Format position with consistent width
-                pos_str = f"{actual_pos:>3}"
-                # Highlight cursor when focused
-                if is_focused and i == self.cursor_index:
-                    lines.append(f"[reverse][cyan]{pos_str}[/] {zettel_id}{marker}[/reverse]")
-                else:
-                    style = "bold gold1" if is_current else "white"
-                    lines.append(f"[cyan]{pos_str}[/] [{style}]{zettel_id}[/]{marker}")
-            list_widget.update("\n".join(lines))
+            cursor = self.cursor_index if self.has_focus else -1
+            listing = "\n".join(
+                _format_trail_line(actual_pos, zettel_id, is_current, i == cursor)
+                for i, (actual_pos, zettel_id, is_current) in enumerate(self.trail_data)
+            )
+        self._set_markup("#trail-list", listing)
 
         # Update nav hints
-        nav_widget = self.query_one("#trail-nav", Static)
         if self.overflow_before > 0 or self.overflow_after > 0:
-            nav_widget.update("[dim][<] older  [>] newer[/]")
+            nav = _TRAIL_NAV
         else:
-            nav_widget.update("")
+            nav = ""
+        self._set_markup("#trail-nav", nav)
+
+    def _set_markup(self, selector: str, markup: str) -> None:
+        """Push markup to a widget, skipping the update when unchanged.
+
+        refresh_trail fires from checkout, resize and back/forward; most
+        of the four widgets are identical between calls, so equal content
+        short-circuits before the layout pass.
+        """
+        if self._last_markup.get(selector) != markup:
+            self._last_markup[selector] = markup
+            widget = self._widgets.get(selector)
+            if widget is None:
+                widget = self._widgets[selector] = self.query_one(selector, Static)
+            widget.update(markup)
 
     def checkout(self, zettel_id: str) -> None:
         """Add a card to the trail and refresh display."""
@@ -184,11 +252,11 @@ class TrailPanel(Widget):
 
     def on_focus(self) -> None:
         """When focused, set cursor to current trail position."""
-        # Find the current position in visible entries
-        for i, (_, _, is_current) in enumerate(self.trail_data):
-            if is_current:
-                self.cursor_index = i
-                break
+        # The trail stores parallel arrays, so the current row is just the
+        # position offset into the window — no scan over the entries
+        idx = self.trail.position - self.trail.window_start
+        if 0 <= idx < len(self.trail_data):
+            self.cursor_index = idx
         self._update_display()
 
     def on_blur(self) -> None: